@@ -1,19 +1,34 @@
 import pandas as pd
 import datetime
-import requests
-import xmltodict
-import urllib.parse
+from ..utils.transport import get_transport
+from ..utils.keypool import ServiceKeyPool
+from ..utils.frame import FrameBuilder
+from ..utils.parser import parse_xml
+
+
+# 응답 items(또는 body) 아래 행 요소 이름
+ITEM_TAGS = ("item", "bidDateInfoItem", "estimationInfo", "registered", "bidInfo",
+             "bidHistoryInfo", "stockholderInfo", "corporatebodyInfo", "rentalInfo")
 
 
 class Kamco:
     """
     KAMCO Open API 클래스
+
+    parameters
+    ----------
+    service_key : str, list
+        공공 데이터 포털 Open API 서비스키 (여러 개의 서비스키 목록 또는 ServiceKeyPool도 가능)
+    transport : Transport, optional
+        HTTP 요청 공용 전송 객체, by default None (기본 공용 객체 사용)
     """
 
-    def __init__(self, service_key=None):
+    def __init__(self, service_key=None, transport=None):
 
         # 전역 변수
         self.serviceKey = service_key
+        self.key_pool = ServiceKeyPool.from_value(service_key)
+        self.transport = transport or get_transport()
         self.numOfRows = 99999
         self.page = 1
         self.endpoint = "http://openapi.onbid.co.kr/openapi/services"
@@ -107,7 +122,6 @@ class Kamco:
 
         # 기본 파라미터
         params = {
-            "serviceKey": urllib.parse.unquote(self.serviceKey),
             "numOfRows": self.numOfRows,
             "page": self.page,
         }
@@ -115,96 +129,35 @@ class Kamco:
 
         # 요청
         try:
-            response = requests.get(url, params=params, verify=False)
+            response = self.transport.get(url, params=params, verify=False, key_pool=self.key_pool)
         except:
             print("API 요청 오류")
             return None
 
         try:
-            data = xmltodict.parse(response.text)
+            parsed = parse_xml(response.content, item_tags=ITEM_TAGS)
         except:
             print("XML-Dictionary 변환 오류")
             return None
 
-        try:
-            body = data['response']['body']
-        except:
-            print(data.get("response").get("header").get("resultMsg"))
+        if parsed.root != "response" or parsed.body is None:
+            print(parsed.result_msg)
             return None
 
         # 데이터프레임으로 변환
         try:
+            # items 아래 행 요소(item, bidInfo 등) 또는 body 아래 item 요소가 존재하는 경우
+            if parsed.count:
+                builder = FrameBuilder()
+                builder.add_columns(parsed.columns)
+                df = builder.build()
 
-            # 바디에 items 키 값이 존재하는 경우
-            if body.get("items") is not None:
-
-                if body['items'].get("bidDateInfoItem"):
-                    if type(body['items'].get("bidDateInfoItem")) == dict:
-                        df = pd.DataFrame([body['items']['bidDateInfoItem']])
-                    else:
-                        df = pd.DataFrame(body['items']['bidDateInfoItem'])
-
-                elif body['items'].get("estimationInfo"):
-                    if type(body['items'].get("estimationInfo")) == dict:
-                        df = pd.DataFrame([body['items']['estimationInfo']])
-                    else:
-                        df = pd.DataFrame(body['items']['estimationInfo'])
-
-                elif body['items'].get("registered"):
-                    if type(body['items'].get("registered")) == dict:
-                        df = pd.DataFrame([body['items']['registered']])
-                    else:
-                        df = pd.DataFrame(body['items']['registered'])
-
-                elif body['items'].get("bidInfo"):
-                    if type(body['items'].get("bidInfo")) == dict:
-                        df = pd.DataFrame([body['items']['bidInfo']])
-                    else:
-                        df = pd.DataFrame(body['items']['bidInfo'])
-
-                elif body['items'].get("bidHistoryInfo"):
-                    if type(body['items'].get("bidHistoryInfo")) == dict:
-                        df = pd.DataFrame([body['items']['bidHistoryInfo']])
-                    else:
-                        df = pd.DataFrame(body['items']['bidHistoryInfo'])
-
-                elif body['items'].get("stockholderInfo"):
-                    if type(body['items'].get("stockholderInfo")) == dict:
-                        df = pd.DataFrame([body['items']['stockholderInfo']])
-                    else:
-                        df = pd.DataFrame(body['items']['stockholderInfo'])
-
-                elif body['items'].get("corporatebodyInfo"):
-                    if type(body['items'].get("corporatebodyInfo")) == dict:
-                        df = pd.DataFrame([body['items']['corporatebodyInfo']])
-                    else:
-                        df = pd.DataFrame(body['items']['corporatebodyInfo'])
-
-                elif body['items'].get("rentalInfo"):
-                    if type(body['items'].get("rentalInfo")) == dict:
-                        df = pd.DataFrame([body['items']['rentalInfo']])
-                    else:
-                        df = pd.DataFrame(body['items']['rentalInfo'])
-
-                else:
-                    if type(body['items']['item']) == dict:
-                        df = pd.DataFrame([body['items']['item']])
-                    else:
-                        df = pd.DataFrame(body['items']['item'])
-
-            # 바디에 items 키 값이 존재하지 않는 경우
+            # 행 요소가 존재하지 않는 경우
             else:
-
-                # items 대신 item 키 값이 존재하는 경우
-                if body.get("item"):
-                    df = pd.DataFrame([body['item']])
-
-                # items와 item 모두 키 값이 존재하지 않는 경우
-                else:
-                    print("데이터가 없습니다.")
-                    return None
+                print("데이터가 없습니다.")
+                return None
         except:
             print("데이터 프레임 생성 오류")
-            return body
+            return parsed.body
 
         return df
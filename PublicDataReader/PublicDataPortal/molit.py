@@ -29,14 +29,20 @@ molit(Ministry of Land, Infrastructure and Transport)
     10.건축물대장 지역지구구역 조회
 """
 
+import itertools
+import numpy as np
 import pandas as pd
 import time
 import datetime
 import logging
-import requests
-import xmltodict
-import urllib.parse
-from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
+from ..utils.transport import get_transport
+from ..utils.keypool import ServiceKeyPool
+from ..utils.concurrency import imap_ordered
+from ..utils.frame import FrameBuilder
+from ..utils.parser import parse_xml
+from ..utils.coerce import coerce_frame, compact_frame, INTEGER, FLOAT, DATE, CATEGORY
+from ..utils.code import get_bdong_codes
 
 
 class TransactionPrice:
@@ -45,12 +51,16 @@ class TransactionPrice:
 
     parameters
     ----------
-    service_key : str
-        국토교통부 Open API 서비스키
+    service_key : str, list
+        국토교통부 Open API 서비스키 (여러 개의 서비스키 목록 또는 ServiceKeyPool도 가능)
+    transport : Transport, optional
+        HTTP 요청 공용 전송 객체, by default None (기본 공용 객체 사용)
     """
 
-    def __init__(self, service_key=None):
+    def __init__(self, service_key=None, transport=None):
         self.serviceKey = service_key
+        self.key_pool = ServiceKeyPool.from_value(service_key)
+        self.transport = transport or get_transport()
         self.meta_dict = {
             "아파트": {
                 "매매": {
@@ -121,6 +131,23 @@ class TransactionPrice:
                                 '거래금액', '보증금액', '보증금', '월세금액', '월세', '종전계약보증금', '종전계약월세']
         self.float_columns = ['전용면적', '대지권면적',
                               '대지면적', '연면적', '계약면적', '건물면적', '거래면적']
+        # 날짜형 컬럼과 날짜 형식 (ex. 해제사유발생일: 22.03.15)
+        # 형식이 다른 값은 전체 조회를 중단하지 않도록 결측값(NaT)으로 변환
+        self.date_columns = {'해제사유발생일': '%y.%m.%d'}
+        # compact=True 일 때 사용할 컬럼 타입 (반복되는 코드, 이름은 범주형, 숫자는 값 범위에 맞는 타입)
+        self.compact_schema = {
+            '년': 'Int16', '월': 'Int8', '일': 'Int8', '층': 'Int16', '건축년도': 'Int16',
+            '거래금액': 'Int32', '보증금액': 'Int32', '보증금': 'Int32', '월세금액': 'Int32',
+            '월세': 'Int32', '종전계약보증금': 'Int32', '종전계약월세': 'Int32',
+            **{col: 'float32' for col in self.float_columns},
+            **{col: CATEGORY for col in [
+                '지역코드', '시군구', '법정동', '도로명', '아파트', '단지', '연립다세대', '주택유형',
+                '유형', '용도지역', '건물주용도', '지목', '구분', '거래유형', '중개사소재지',
+                '해제여부', '계약구분', '계약기간', '갱신요구권사용', '일련번호',
+                '도로명건물본번호코드', '도로명건물부번호코드', '도로명시군구코드', '도로명일련번호코드',
+                '도로명지상지하코드', '도로명코드', '법정동본번코드', '법정동부번코드',
+                '법정동시군구코드', '법정동읍면동코드', '법정동지번코드']},
+        }
 
     def get_data(self,
                  property_type,
@@ -130,6 +157,8 @@ class TransactionPrice:
                  start_year_month=None,
                  end_year_month=None,
                  verbose=False,
+                 max_workers=1,
+                 compact=False,
                  **kwargs):
         """
         부동산 실거래가 조회
@@ -150,10 +179,101 @@ class TransactionPrice:
             조회할 종료 연월 (ex. 201901), by default None
         verbose : bool, optional
             진행 상황 출력 여부, by default False
+        max_workers : int, optional
+            기간 조회 시 동시에 요청할 월 수, by default 1
+            (1보다 크면 월별 요청을 병렬로 보내고 결과는 연월 순서대로 합칩니다.)
+        compact : bool, optional
+            메모리를 적게 사용하는 컬럼 타입으로 변환 여부, by default False
+            (코드, 이름 컬럼은 범주형, 년/월/일/층은 작은 정수형, 면적은 float32로 반환합니다.)
         **kwargs : dict
             API 요청에 필요한 추가 인자
         """
+        columns, pages = self._iter_month_items(property_type, trade_type, sigungu_code,
+                                                year_month=year_month,
+                                                start_year_month=start_year_month,
+                                                end_year_month=end_year_month,
+                                                verbose=verbose,
+                                                max_workers=max_workers,
+                                                **kwargs)
+        # 월별 결과를 모아 데이터프레임을 한 번만 생성
+        builder = FrameBuilder(columns)
+        for data in pages:
+            builder.add_columns(data)
+        if not len(builder) and not (start_year_month and end_year_month):
+            return builder.build()
+        # 컬럼 타입 변환
+        df = self._convert_column_types(builder.build())
+        if compact:
+            df = compact_frame(df, self.compact_schema)
+        return df
+
+    def iter_pages(self,
+                   property_type,
+                   trade_type,
+                   sigungu_code,
+                   year_month=None,
+                   start_year_month=None,
+                   end_year_month=None,
+                   verbose=False,
+                   max_workers=1,
+                   compact=False,
+                   **kwargs):
+        """
+        부동산 실거래가 연월별 조회 제너레이터
+
+        연월별 응답을 받는 대로 컬럼 타입을 변환한 데이터프레임으로 반환합니다.
+        결과가 없는 연월은 건너뜁니다. 파라미터는 get_data와 같습니다.
 
+        Yields
+        ------
+        DataFrame
+            연월 하나의 실거래가 데이터
+        """
+        columns, pages = self._iter_month_items(property_type, trade_type, sigungu_code,
+                                                year_month=year_month,
+                                                start_year_month=start_year_month,
+                                                end_year_month=end_year_month,
+                                                verbose=verbose,
+                                                max_workers=max_workers,
+                                                **kwargs)
+        for data in pages:
+            if not data:
+                continue
+            builder = FrameBuilder(columns)
+            builder.add_columns(data)
+            # 컬럼 타입 변환
+            df = self._convert_column_types(builder.build())
+            if compact:
+                df = compact_frame(df, self.compact_schema)
+            yield df
+
+    def iter_records(self, *args, **kwargs):
+        """
+        부동산 실거래가 거래 건별 조회 제너레이터
+
+        iter_pages의 결과를 거래 1건씩 딕셔너리로 반환합니다. 파라미터는 get_data와 같습니다.
+
+        Yields
+        ------
+        dict
+            거래 1건
+        """
+        for df in self.iter_pages(*args, **kwargs):
+            yield from df.to_dict("records")
+
+    def _iter_month_items(self,
+                          property_type,
+                          trade_type,
+                          sigungu_code,
+                          year_month=None,
+                          start_year_month=None,
+                          end_year_month=None,
+                          verbose=False,
+                          max_workers=1,
+                          **kwargs):
+        """
+        API 컬럼 목록과 연월별 컬럼 데이터 제너레이터 반환
+        """
         try:
             # 부동산 이름과 거래 유형으로 API URL 선택 (ex. 아파트, 매매)
             url = self.meta_dict.get(property_type).get(trade_type).get("url")
@@ -163,9 +283,8 @@ class TransactionPrice:
         except AttributeError:
             raise AttributeError("부동산 이름과 거래 유형을 확인해주세요.")
 
-        # 서비스키, 행수, 시군구코드 설정
+        # 행수, 시군구코드 설정
         params = {
-            "serviceKey": urllib.parse.unquote(self.serviceKey),
             "numOfRows": "99999",
             "LAWD_CD": sigungu_code,
         }
@@ -175,70 +294,284 @@ class TransactionPrice:
 
         # 기간으로 조회
         if start_year_month and end_year_month:
-            start_date = datetime.datetime.strptime(
-                str(start_year_month), "%Y%m")
-            start_date = datetime.datetime.strftime(start_date, "%Y-%m")
-            end_date = datetime.datetime.strptime(str(end_year_month), "%Y%m")
-            end_date += datetime.timedelta(days=31)
-            end_date = datetime.datetime.strftime(end_date, "%Y-%m")
-            ts = pd.date_range(start=start_date, end=end_date, freq="m")
-            date_list = list(ts.strftime("%Y%m"))
-
-            df = pd.DataFrame(columns=columns)
-            for year_month in date_list:
-                if verbose:
-                    print(year_month)
-                params['DEAL_YMD'] = year_month
-                res = requests.get(url, params=params, verify=False)
-                res_json = xmltodict.parse(res.text)
-                if res_json['response']['header']['resultCode'] != '00':
-                    error_message = res_json['response']['header']['resultMsg']
-                    raise Exception(error_message)
-                items = res_json['response']['body']['items']
-                if not items:
-                    continue
-                data = items['item']
-                if isinstance(data, list):
-                    sub = pd.DataFrame(data)
-                elif isinstance(data, dict):
-                    sub = pd.DataFrame([data])
-                df = pd.concat([df, sub], axis=0, ignore_index=True)
-
+            date_list = self._get_date_list(start_year_month, end_year_month)
         # 기간으로 조회하지 않고 단일 연월로 조회
         else:
+            date_list = [year_month]
+
+        # 월별 요청 병렬 처리 (결과는 입력 순서대로 반환)
+        pages = imap_ordered(lambda ym: self._get_month_columns(url, params, ym, verbose),
+                             date_list, max_workers=max_workers)
+        return columns, pages
+
+    def get_bulk_data(self,
+                      sigungu_codes,
+                      start_year_month,
+                      end_year_month,
+                      property_types=None,
+                      trade_types=None,
+                      max_workers=8,
+                      combine=True,
+                      verbose=False,
+                      **kwargs):
+        """
+        부동산 실거래가 대량 조회 (시군구 × 부동산 유형 × 거래 유형 × 연월)
+
+        모든 요청을 하나의 작업 풀에서 max_workers개까지 동시에 처리합니다.
+
+        Parameters
+        ----------
+        sigungu_codes : list
+            시군구코드 목록 (ex. ['11110', '11140'])
+        start_year_month : str
+            조회할 시작 연월 (ex. 201901)
+        end_year_month : str
+            조회할 종료 연월 (ex. 201912)
+        property_types : list, optional
+            부동산 이름 목록 (ex. ['아파트', '오피스텔']), by default None (전체)
+        trade_types : list, optional
+            거래 유형 목록 (ex. ['매매']), by default None (전체)
+            부동산 이름에 해당 거래 유형이 없으면 건너뜁니다.
+        max_workers : int, optional
+            동시에 처리할 최대 요청 수, by default 8
+        combine : bool, optional
+            True이면 하나의 데이터프레임으로 합쳐서 반환하고,
+            False이면 (부동산 이름, 거래 유형)별 데이터프레임 딕셔너리를 반환, by default True
+        verbose : bool, optional
+            진행 상황 출력 여부, by default False
+        **kwargs : dict
+            API 요청에 필요한 추가 인자
+
+        Returns
+        -------
+        DataFrame or dict
+            부동산유형, 거래구분 컬럼이 추가된 실거래가 데이터
+        """
+        if isinstance(sigungu_codes, str):
+            sigungu_codes = [sigungu_codes]
+        combinations = self._get_combinations(property_types, trade_types)
+        date_list = self._get_date_list(start_year_month, end_year_month)
+        params = self._get_bulk_params(**kwargs)
+
+        # (부동산 이름, 거래 유형, 시군구코드, 연월) 단위 작업 목록
+        tasks = [(property_type, trade_type, sigungu_code, year_month)
+                 for property_type, trade_type in combinations
+                 for sigungu_code in sigungu_codes
+                 for year_month in date_list]
+
+        def fetch(task):
+            property_type, trade_type, sigungu_code, year_month = task
+            url = self.meta_dict[property_type][trade_type]["url"]
             if verbose:
-                print(year_month)
-            df = pd.DataFrame(columns=columns)
-            params['DEAL_YMD'] = year_month
-            res = requests.get(url, params=params, verify=False)
-            res_json = xmltodict.parse(res.text)
-            if res_json['response']['header']['resultCode'] != '00':
-                error_message = res_json['response']['header']['resultMsg']
-                raise Exception(error_message)
-            items = res_json['response']['body']['items']
-            if not items:
-                return pd.DataFrame(columns=columns)
-            data = items['item']
-            if isinstance(data, list):
-                sub = pd.DataFrame(data)
-            elif isinstance(data, dict):
-                sub = pd.DataFrame([data])
-            df = pd.concat([df, sub], axis=0, ignore_index=True)
+                print(property_type, trade_type, sigungu_code)
+            return self._get_month_columns(url, dict(params, LAWD_CD=sigungu_code), year_month, verbose)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            subs = list(executor.map(fetch, tasks))
+
+        # 조합별 데이터프레임 생성
+        result = {}
+        for property_type, trade_type in combinations:
+            columns = self.meta_dict[property_type][trade_type]["columns"]
+            builder = FrameBuilder(columns)
+            for task, data in zip(tasks, subs):
+                if task[:2] == (property_type, trade_type):
+                    builder.add_columns(data)
+            df = self._convert_column_types(builder.build())
+            df.insert(0, "거래구분", trade_type)
+            df.insert(0, "부동산유형", property_type)
+            result[(property_type, trade_type)] = df
+
+        if not combine:
+            return result
+        if not result:
+            return pd.DataFrame(columns=["부동산유형", "거래구분"])
+        return pd.concat(list(result.values()), axis=0, ignore_index=True)
+
+    def sync(self,
+             store,
+             sigungu_codes,
+             start_year_month,
+             end_year_month=None,
+             property_types=None,
+             trade_types=None,
+             refresh_months=3,
+             max_workers=8,
+             verbose=False,
+             **kwargs):
+        """
+        부동산 실거래가 로컬 저장소 동기화
 
-        # 컬럼 타입 변환
+        저장소에 없는 파티션(부동산 유형 × 거래 유형 × 시군구 × 연월)과
+        지연 신고, 계약 해제로 자료가 바뀔 수 있는 최근 refresh_months개월 파티션만 요청합니다.
+
+        Parameters
+        ----------
+        store : PartitionStore
+            파티션 저장소
+        sigungu_codes : list
+            시군구코드 목록 (ex. ['11110', '11140'])
+        start_year_month : str
+            동기화할 시작 연월 (ex. 200601)
+        end_year_month : str, optional
+            동기화할 종료 연월 (ex. 202212), by default None (이번 달)
+        property_types : list, optional
+            부동산 이름 목록 (ex. ['아파트']), by default None (전체)
+        trade_types : list, optional
+            거래 유형 목록 (ex. ['매매']), by default None (전체)
+        refresh_months : int, optional
+            이미 저장되어 있어도 다시 요청할 최근 개월 수 (이번 달 포함), by default 3
+        max_workers : int, optional
+            동시에 처리할 최대 요청 수, by default 8
+        verbose : bool, optional
+            진행 상황 출력 여부, by default False
+        **kwargs : dict
+            API 요청에 필요한 추가 인자
+
+        Returns
+        -------
+        DataFrame
+            요청한 파티션 목록 (부동산유형, 거래구분, 시군구코드, 연월, 건수)
+        """
+        if isinstance(sigungu_codes, str):
+            sigungu_codes = [sigungu_codes]
+        combinations = self._get_combinations(property_types, trade_types)
+
+        today = datetime.date.today()
+        if end_year_month is None:
+            end_year_month = today.strftime("%Y%m")
+        date_list = self._get_date_list(start_year_month, end_year_month)
+
+        # 다시 요청할 최근 연월 (이번 달부터 refresh_months개월)
+        refresh_start = pd.Period(today, freq="M") - max(refresh_months - 1, 0)
+        refresh_start = refresh_start.strftime("%Y%m") if refresh_months else None
+
+        # 저장소에 없거나 최근 연월인 파티션만 요청
+        tasks = [(property_type, trade_type, sigungu_code, year_month)
+                 for property_type, trade_type in combinations
+                 for sigungu_code in sigungu_codes
+                 for year_month in date_list
+                 if (refresh_start is not None and year_month >= refresh_start)
+                 or not store.exists(property_type, trade_type, sigungu_code, year_month)]
+
+        params = self._get_bulk_params(**kwargs)
+
+        def fetch(task):
+            property_type, trade_type, sigungu_code, year_month = task
+            url = self.meta_dict[property_type][trade_type]["url"]
+            columns = self.meta_dict[property_type][trade_type]["columns"]
+            if verbose:
+                print(property_type, trade_type, sigungu_code)
+            builder = FrameBuilder(columns)
+            builder.add_columns(self._get_month_columns(url, dict(params, LAWD_CD=sigungu_code), year_month, verbose))
+            df = self._convert_column_types(builder.build())
+            # 작업마다 바로 저장하여 중단되어도 다음 동기화에서 이어서 요청
+            store.write(property_type, trade_type, sigungu_code, year_month, df)
+            return len(df)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            counts = list(executor.map(fetch, tasks))
+
+        return pd.DataFrame([task + (count,) for task, count in zip(tasks, counts)],
+                            columns=["부동산유형", "거래구분", "시군구코드", "연월", "건수"])
+
+    def _get_combinations(self, property_types=None, trade_types=None):
+        """
+        (부동산 이름, 거래 유형) 조합 목록 반환
+
+        Parameters
+        ----------
+        property_types : str, list, optional
+            부동산 이름 목록, by default None (전체)
+        trade_types : str, list, optional
+            거래 유형 목록, by default None (전체)
+            부동산 이름에 해당 거래 유형이 없으면 건너뜁니다.
+        """
+        if property_types is None:
+            property_types = list(self.meta_dict.keys())
+        elif isinstance(property_types, str):
+            property_types = [property_types]
+        if isinstance(trade_types, str):
+            trade_types = [trade_types]
+        combinations = []
+        for property_type in property_types:
+            if property_type not in self.meta_dict:
+                raise AttributeError("부동산 이름과 거래 유형을 확인해주세요.")
+            for trade_type in self.meta_dict[property_type].keys():
+                if trade_types is None or trade_type in trade_types:
+                    combinations.append((property_type, trade_type))
+        return combinations
+
+    def _get_bulk_params(self, **kwargs):
+        """
+        대량 조회(get_bulk_data, sync) 공통 요청 파라미터 반환
+        """
+        params = {
+            "numOfRows": "99999",
+        }
+        params.update(kwargs)
+        return params
+
+    def get_schema(self, columns):
+        """
+        컬럼 타입 스키마 반환
+
+        integer_columns, float_columns, date_columns 중 columns에 포함된 컬럼의 타입을 반환합니다.
+
+        Parameters
+        ----------
+        columns : list
+            컬럼 목록 (ex. meta_dict["아파트"]["매매"]["columns"])
+
+        Returns
+        -------
+        dict
+            컬럼명을 키로, 타입("integer", "float") 또는 ("date", 날짜 형식, "coerce") 튜플을 값으로 하는 딕셔너리
+        """
+        schema = {col: INTEGER for col in self.integer_columns if col in columns}
+        schema.update({col: FLOAT for col in self.float_columns if col in columns})
+        schema.update({col: (DATE, fmt, "coerce") for col, fmt in self.date_columns.items() if col in columns})
+        return schema
+
+    def _convert_column_types(self, df):
+        """
+        정수형, 실수형 컬럼 타입 변환
+        """
         try:
-            for col in self.integer_columns:
-                if col in df.columns:
-                    df[col] = pd.to_numeric(df[col].apply(
-                        lambda x: x.strip().replace(",", "") if x is not None and not pd.isnull(x) else x)).astype("Int64")
-            for col in self.float_columns:
-                if col in df.columns:
-                    df[col] = pd.to_numeric(df[col])
+            df = coerce_frame(df, self.get_schema(df.columns))
         except Exception as e:
             raise Exception(e)
-
         return df
 
+    def _get_date_list(self, start_year_month, end_year_month):
+        """
+        시작 연월부터 종료 연월까지의 연월 목록 반환 (ex. ['202201', '202202'])
+        """
+        start_date = datetime.datetime.strptime(str(start_year_month), "%Y%m")
+        start_date = datetime.datetime.strftime(start_date, "%Y-%m")
+        end_date = datetime.datetime.strptime(str(end_year_month), "%Y%m")
+        end_date += datetime.timedelta(days=31)
+        end_date = datetime.datetime.strftime(end_date, "%Y-%m")
+        ts = pd.date_range(start=start_date, end=end_date, freq="m")
+        return list(ts.strftime("%Y%m"))
+
+    def _get_month_columns(self, url, params, year_month, verbose=False):
+        """
+        단일 연월 실거래가 요청
+
+        컬럼별 값 리스트 딕셔너리를 반환하며, 결과가 없으면 빈 딕셔너리를 반환합니다.
+        """
+        if verbose:
+            print(year_month)
+        params = dict(params, DEAL_YMD=year_month)
+        res = self.transport.get(url, params=params, verify=False, key_pool=self.key_pool)
+        parsed = parse_xml(res.content)
+        if parsed.root != "response":
+            raise Exception(parsed.result_msg or "API 요청이 실패했습니다.")
+        if parsed.result_code != '00':
+            raise Exception(parsed.result_msg)
+        return parsed.columns
+
 
 class BuildingLedger:
     """
@@ -246,12 +579,16 @@ class BuildingLedger:
 
     parameters
     ----------
-    service_key : str
-        국토교통부 API 서비스키
+    service_key : str, list
+        국토교통부 API 서비스키 (여러 개의 서비스키 목록 또는 ServiceKeyPool도 가능)
+    transport : Transport, optional
+        HTTP 요청 공용 전송 객체, by default None (기본 공용 객체 사용)
     """
 
-    def __init__(self, service_key=None):
+    def __init__(self, service_key=None, transport=None):
         self.serviceKey = service_key
+        self.key_pool = ServiceKeyPool.from_value(service_key)
+        self.transport = transport or get_transport()
         self.meta_dict = {
             "기본개요": {
                 "url": f"http://apis.data.go.kr/1613000/BldRgstService_v2/getBrBasisOulnInfo",
@@ -294,6 +631,35 @@ class BuildingLedger:
                 "columns": ['bjdongCd', 'block', 'bun', 'crtnDay', 'etcJijigu', 'ji', 'jijiguCd', 'jijiguCdNm', 'jijiguGbCd', 'jijiguGbCdNm', 'lot', 'mgmBldrgstPk', 'newPlatPlc', 'platGbCd', 'platPlc', 'reprYn', 'rnum', 'sigunguCd', 'splotNm']
             },
         }
+        # compact=True 일 때 사용할 컬럼 타입 (영문 컬럼명 기준)
+        self.compact_schema = {
+            **{col: 'float32' for col in [
+                'archArea', 'area', 'atchBldArea', 'bcRat', 'capaLube', 'capaPsper', 'engrEpi',
+                'engrRat', 'heit', 'indrAutoArea', 'indrMechArea', 'oudrAutoArea', 'oudrMechArea',
+                'platArea', 'totArea', 'totDongTotArea', 'vlRat', 'vlRatEstmTotArea']},
+            **{col: 'Int16' for col in [
+                'atchBldCnt', 'bylotCnt', 'emgenUseElvtCnt', 'flrNo', 'grndFlrCnt', 'mainBldCnt',
+                'rideUseElvtCnt', 'ugrndFlrCnt']},
+            **{col: 'Int32' for col in [
+                'fmlyCnt', 'hhldCnt', 'hoCnt', 'indrAutoUtcnt', 'indrMechUtcnt', 'oudrAutoUtcnt',
+                'oudrMechUtcnt', 'rnum', 'totPkngCnt']},
+            'hsprc': 'Int64',
+            **{col: CATEGORY for col in [
+                'sigunguCd', 'bjdongCd', 'platGbCd', 'platPlc', 'newPlatPlc', 'bldNm', 'dongNm',
+                'splotNm', 'block', 'lot', 'naBjdongCd', 'naRoadCd', 'naUgrndCd', 'naMainBun',
+                'naSubBun', 'regstrGbCd', 'regstrGbCdNm', 'regstrKindCd', 'regstrKindCdNm',
+                'mainPurpsCd', 'mainPurpsCdNm', 'etcPurps', 'strctCd', 'strctCdNm', 'etcStrct',
+                'roofCd', 'roofCdNm', 'etcRoof', 'mainAtchGbCd', 'mainAtchGbCdNm', 'flrGbCd',
+                'flrGbCdNm', 'flrNoNm', 'exposPubuseGbCd', 'exposPubuseGbCdNm', 'guyukCd',
+                'guyukCdNm', 'jiguCd', 'jiguCdNm', 'jiyukCd', 'jiyukCdNm', 'jijiguCd', 'jijiguCdNm',
+                'jijiguGbCd', 'jijiguGbCdNm', 'etcJijigu', 'reprYn', 'newOldRegstrGbCd',
+                'newOldRegstrGbCdNm', 'pmsnoGbCd', 'pmsnoGbCdNm', 'pmsnoKikCd', 'pmsnoKikCdNm',
+                'pmsnoYear', 'modeCd', 'modeCdNm', 'etcMode', 'unitGbCd', 'unitGbCdNm', 'engrGrade',
+                'gnBldCert', 'gnBldGrade', 'itgBldCert', 'itgBldGrade', 'rserthqkAblty',
+                'rserthqkDsgnApplyYn', 'areaExctYn', 'crtnDay', 'pmsDay', 'stcnsDay', 'useAprDay',
+                'atchRegstrGbCd', 'atchRegstrGbCdNm', 'atchPlatGbCd', 'atchSigunguCd',
+                'atchBjdongCd', 'atchSplotNm', 'atchBlock', 'atchLot', 'atchEtcJibunNm']},
+        }
 
     def get_data(self,
                  ledger_type,
@@ -303,7 +669,9 @@ class BuildingLedger:
                  ji=None,
                  translate=True,
                  verbose=False,
-                 wait_time=30,
+                 wait_time=None,
+                 compact=False,
+                 max_workers=4,
                  **kwargs):
         """
         건축물대장 정보 조회
@@ -325,9 +693,306 @@ class BuildingLedger:
         verbose : bool
             진행 상황 출력 여부 (기본값: False)
         wait_time : int
-            API 요청 간의 대기 시간 (초) (기본값: 30초)
+            API 추가 요청 전 고정 대기 시간 (초) (기본값: None)
+            요청 속도는 Transport의 rate_limiter로 제한하며 (기본 공용 Transport는
+            공공데이터포털 요청을 초당 30건으로 제한), 이 값을 지정하면 페이지마다 추가로 대기합니다.
+        compact : bool
+            메모리를 적게 사용하는 컬럼 타입으로 변환 여부 (기본값: False)
+            코드, 이름 컬럼은 범주형, 개수와 층은 정수형, 면적과 비율은 float32로 변환합니다.
+        max_workers : int
+            첫 페이지의 totalCount로 계산한 나머지 페이지를 동시에 요청할 수 (기본값: 4)
+            결과는 페이지 순서대로 합치며, wait_time을 지정하면 순차 요청합니다.
+        **kwargs : dict
+            API 요청에 필요한 추가 인자
+        """
+        columns, pages = self._iter_page_items(ledger_type, sigungu_code, bdong_code,
+                                               bun=bun, ji=ji, verbose=verbose,
+                                               wait_time=wait_time, max_workers=max_workers,
+                                               **kwargs)
+        # 페이지별 결과를 모아 데이터프레임을 한 번만 생성
+        builder = FrameBuilder(columns)
+        for data in pages:
+            builder.add_columns(data)
+        df = builder.build()
+        if compact:
+            df = compact_frame(df, self.compact_schema)
+        # 컬럼명 한글로 변경
+        if translate:
+            df = self.translate_columns(df)
+        return df
+
+    def iter_pages(self,
+                   ledger_type,
+                   sigungu_code,
+                   bdong_code,
+                   bun=None,
+                   ji=None,
+                   translate=True,
+                   verbose=False,
+                   wait_time=None,
+                   compact=False,
+                   max_workers=4,
+                   **kwargs):
+        """
+        건축물대장 정보 페이지별 조회 제너레이터
+
+        페이지별 응답을 받는 대로 데이터프레임으로 반환합니다. 파라미터는 get_data와 같습니다.
+
+        Yields
+        ------
+        DataFrame
+            페이지 하나의 건축물대장 데이터
+        """
+        columns, pages = self._iter_page_items(ledger_type, sigungu_code, bdong_code,
+                                               bun=bun, ji=ji, verbose=verbose,
+                                               wait_time=wait_time, max_workers=max_workers,
+                                               **kwargs)
+        for data in pages:
+            builder = FrameBuilder(columns)
+            builder.add_columns(data)
+            df = builder.build()
+            if compact:
+                df = compact_frame(df, self.compact_schema)
+            # 컬럼명 한글로 변경
+            if translate:
+                df = self.translate_columns(df)
+            yield df
+
+    def iter_records(self, *args, **kwargs):
+        """
+        건축물대장 정보 건별 조회 제너레이터
+
+        iter_pages의 결과를 1건씩 딕셔너리로 반환합니다. 파라미터는 get_data와 같습니다.
+
+        Yields
+        ------
+        dict
+            건축물대장 1건
+        """
+        for df in self.iter_pages(*args, **kwargs):
+            yield from df.to_dict("records")
+
+    def get_bulk_data(self,
+                      sigungu_code,
+                      ledger_types=None,
+                      bdong_codes=None,
+                      translate=True,
+                      compact=False,
+                      max_workers=8,
+                      verbose=False,
+                      **kwargs):
+        """
+        시군구 전체 건축물대장 정보 조회 (건축물대장 유형 × 법정동)
+
+        법정동 코드 표에서 시군구의 최하위 법정동 목록을 찾아 모든 요청을
+        하나의 작업 풀에서 max_workers개까지 동시에 처리합니다.
+        요청 속도는 Transport의 rate_limiter로 제한합니다.
+
+        Parameters
+        ----------
+        sigungu_code : str
+            시군구 코드 (ex. 11110)
+        ledger_types : list, optional
+            건축물대장 유형 목록 (ex. ['표제부', '전유부']), by default None (전체)
+        bdong_codes : list, optional
+            법정동 코드(5자리) 목록 (ex. ['10100', '10200']), by default None
+            지정하지 않으면 get_bdong_codes(sigungu_code)의 결과를 사용합니다.
+        translate : bool
+            한글 컬럼명으로 변환 여부 (기본값: True)
+        compact : bool
+            메모리를 적게 사용하는 컬럼 타입으로 변환 여부 (기본값: False)
+        max_workers : int
+            동시에 처리할 최대 (건축물대장 유형, 법정동) 수 (기본값: 8)
+            법정동 하나의 페이지는 순차 요청합니다.
+        verbose : bool
+            진행 상황 출력 여부 (기본값: False)
+        **kwargs : dict
+            API 요청에 필요한 추가 인자
+
+        Returns
+        -------
+        dict
+            건축물대장 유형을 키로, 데이터프레임을 값으로 하는 딕셔너리
+        """
+        if ledger_types is None:
+            ledger_types = list(self.meta_dict.keys())
+        elif isinstance(ledger_types, str):
+            ledger_types = [ledger_types]
+        for ledger_type in ledger_types:
+            if ledger_type not in self.meta_dict:
+                raise AttributeError("건축물대장 유형을 확인해주세요.")
+        if bdong_codes is None:
+            bdong_codes = get_bdong_codes(sigungu_code)
+        elif isinstance(bdong_codes, str):
+            bdong_codes = [bdong_codes]
+
+        # (건축물대장 유형, 법정동 코드) 단위 작업 목록
+        tasks = [(ledger_type, bdong_code)
+                 for ledger_type in ledger_types
+                 for bdong_code in bdong_codes]
+
+        def fetch(task):
+            ledger_type, bdong_code = task
+            if verbose:
+                print(ledger_type, sigungu_code, bdong_code)
+            _, pages = self._iter_page_items(ledger_type, sigungu_code, bdong_code, **kwargs)
+            return list(pages)
+
+        # 작업 결과를 받는 대로 건축물대장 유형별로 모음
+        builders = {ledger_type: FrameBuilder(self.meta_dict[ledger_type]["columns"])
+                    for ledger_type in ledger_types}
+        for (ledger_type, _), pages in zip(tasks, imap_ordered(fetch, tasks, max_workers=max_workers)):
+            for data in pages:
+                builders[ledger_type].add_columns(data)
+
+        result = {}
+        for ledger_type, builder in builders.items():
+            df = builder.build()
+            if compact:
+                df = compact_frame(df, self.compact_schema)
+            if translate:
+                df = self.translate_columns(df)
+            result[ledger_type] = df
+        return result
+
+    def get_profile(self,
+                    sigungu_code,
+                    bdong_code,
+                    bun=None,
+                    ji=None,
+                    ledger_types=None,
+                    how="nested",
+                    translate=True,
+                    max_workers=4,
+                    verbose=False,
+                    **kwargs):
+        """
+        건물별 건축물대장 통합 조회
+
+        같은 주소의 여러 건축물대장을 동시에 조회한 뒤 관리건축물대장PK(mgmBldrgstPk)
+        해시 인덱스로 첫 번째 건축물대장의 행에 나머지 건축물대장을 연결합니다.
+
+        Parameters
+        ----------
+        sigungu_code : str
+            시군구 코드 (ex. 11110)
+        bdong_code : str
+            법정동 코드 (ex. 11000)
+        bun : str
+            번 (ex. 200)
+        ji : str
+            지 (ex. 5)
+        ledger_types : str, list, optional
+            건축물대장 유형 목록, by default None (표제부, 층별개요, 전유공용면적, 지역지구구역)
+            첫 번째 유형의 행을 기준으로 연결합니다.
+        how : str
+            결과 형식 (기본값: nested)
+            - nested: 기준 행마다 나머지 건축물대장 유형 이름의 컬럼에 연결된 행(dict) 목록
+            - wide: 연결된 행의 컬럼을 "건축물대장유형_컬럼명"으로 붙인 넓은 표
+              (PK로 연속 left merge한 결과와 같으며, 1:N 건축물대장이 여러 개면 행 수가 곱해짐)
+        translate : bool
+            한글 컬럼명으로 변환 여부 (기본값: True)
+        max_workers : int
+            동시에 조회할 건축물대장 유형 수 (기본값: 4)
+        verbose : bool
+            진행 상황 출력 여부 (기본값: False)
         **kwargs : dict
             API 요청에 필요한 추가 인자
+
+        Returns
+        -------
+        DataFrame
+            건물별 건축물대장 통합 데이터
+        """
+        if ledger_types is None:
+            ledger_types = ["표제부", "층별개요", "전유공용면적", "지역지구구역"]
+        elif isinstance(ledger_types, str):
+            ledger_types = [ledger_types]
+        for ledger_type in ledger_types:
+            if ledger_type not in self.meta_dict:
+                raise AttributeError("건축물대장 유형을 확인해주세요.")
+        if how not in ("nested", "wide"):
+            raise ValueError("how는 nested 또는 wide만 가능합니다.")
+
+        def fetch(ledger_type):
+            columns, pages = self._iter_page_items(ledger_type, sigungu_code, bdong_code,
+                                                   bun=bun, ji=ji, verbose=verbose, **kwargs)
+            builder = FrameBuilder(columns)
+            for data in pages:
+                builder.add_columns(data)
+            return builder.build()
+
+        frames = dict(zip(ledger_types, imap_ordered(fetch, ledger_types, max_workers=max_workers)))
+        return self._join_ledgers(frames, how=how, translate=translate)
+
+    def _join_ledgers(self, frames, how="nested", translate=True):
+        """
+        건축물대장 유형별 데이터프레임을 관리건축물대장PK로 연결
+
+        첫 번째 데이터프레임을 기준으로, 나머지는 PK별 행 위치 딕셔너리(해시 인덱스)를
+        만들어 행 위치만 계산한 뒤 컬럼을 한 번에 가져옵니다.
+        """
+        key = "mgmBldrgstPk"
+        names = list(frames)
+        base = frames[names[0]]
+        base_keys = base[key].tolist()
+        children = {}
+        for name in names[1:]:
+            df = frames[name]
+            index = {}
+            for pos, pk in enumerate(df[key].tolist()):
+                index.setdefault(pk, []).append(pos)
+            # wide 형식에서는 기준 데이터에 있는 PK 컬럼을 다시 붙이지 않음
+            if how == "wide":
+                df = df.drop(columns=key)
+            if translate:
+                df = self.translate_columns(df)
+            children[name] = (df, index)
+        if translate:
+            base = self.translate_columns(base)
+
+        if how == "nested":
+            result = base.copy()
+            for name, (df, index) in children.items():
+                records = df.to_dict("records")
+                result[name] = [[records[pos] for pos in index.get(pk, ())] for pk in base_keys]
+            return result
+
+        # 기준 행별로 연결된 행 위치의 조합 계산 (연결된 행이 없으면 -1)
+        base_positions = []
+        child_positions = {name: [] for name in children}
+        for i, pk in enumerate(base_keys):
+            lists = [index.get(pk) or [-1] for _, index in children.values()]
+            for combo in itertools.product(*lists):
+                base_positions.append(i)
+                for name, pos in zip(children, combo):
+                    child_positions[name].append(pos)
+
+        base_positions = np.array(base_positions, dtype=int)
+        data = {col: base[col].to_numpy()[base_positions] for col in base.columns}
+        for name, (df, index) in children.items():
+            positions = np.array(child_positions[name], dtype=int)
+            missing = positions < 0
+            for col in df.columns:
+                values = np.append(df[col].to_numpy(dtype=object), np.nan)
+                data[f"{name}_{col}"] = values[np.where(missing, len(values) - 1, positions)]
+        return pd.DataFrame(data, columns=list(data))
+
+    def _iter_page_items(self,
+                         ledger_type,
+                         sigungu_code,
+                         bdong_code,
+                         bun=None,
+                         ji=None,
+                         verbose=False,
+                         wait_time=None,
+                         max_workers=1,
+                         **kwargs):
+        """
+        API 컬럼 목록과 페이지별 컬럼 데이터 제너레이터 반환
+
+        첫 페이지를 요청해 페이지 수를 계산한 뒤 나머지 페이지는 max_workers개까지
+        동시에 요청하고 페이지 순서대로 반환합니다.
         """
         try:
             # 건축물대장 유형으로 API URL 선택 (ex. 기본개요, 표제부, 총괄표제부 등)
@@ -336,9 +1001,8 @@ class BuildingLedger:
             columns = self.meta_dict.get(ledger_type).get("columns")
         except AttributeError:
             raise AttributeError("건축물대장 유형을 확인해주세요.")
-        # 서비스키, 행수, 시군구코드, 법정동코드 설정
+        # 행수, 시군구코드, 법정동코드 설정
         params = {
-            "serviceKey": urllib.parse.unquote(self.serviceKey),
             "numOfRows": 99999,
             "sigunguCd": sigungu_code,
             "bjdongCd": bdong_code,
@@ -350,77 +1014,60 @@ class BuildingLedger:
             params.update({"ji": str(ji).zfill(4)})
         # 선택 파라미터 추가 설정
         params.update(kwargs)
-        # 빈 데이터 프레임 생성
-        df = pd.DataFrame(columns=columns)
+
+        def fetch(page_no):
+            # 다음 페이지 조회 전 대기 (지정한 경우만)
+            if wait_time:
+                time.sleep(wait_time)
+            if verbose:
+                print(f"page {page_no} 요청")
+            _, data = self._get_page(url, dict(params, pageNo=page_no), verbose)
+            return data
+
+        def pages():
+            body, data = self._get_page(url, params, verbose)
+            # 요청 행 수
+            _numOfRows = body['numOfRows']
+            # 총 데이터 크기
+            _totalCount = body['totalCount']
+            # 순회해야 하는 페이지 수
+            page_count = max(-(-int(_totalCount) // int(_numOfRows)), 1)
+            if verbose:
+                print(
+                    f"""- 요청 행 수: {_numOfRows}\n- 현재 페이지 번호: {body['pageNo']}\n- 총 행 수: {_totalCount}\n- 총 페이지 수: {page_count}\n- API 요청 대기시간: {wait_time or 0}초""")
+                if page_count > 1:
+                    print(f"페이지가 {page_count}개 있습니다.")
+            if not data:
+                return
+            yield data
+            # 고정 대기 시간을 지정한 경우 순차 요청
+            workers = 1 if wait_time else max_workers
+            for data in imap_ordered(fetch, range(2, page_count + 1), max_workers=workers):
+                if not data:
+                    return
+                yield data
+
+        return columns, pages()
+
+    def _get_page(self, url, params, verbose=False):
+        """
+        건축물대장 정보 한 페이지 요청
+
+        응답 body 값과 컬럼별 값 리스트 딕셔너리(결과가 없으면 빈 딕셔너리)를 반환합니다.
+        """
         # API 요청
-        res = requests.get(url, params=params, verify=False)
-        # 요청 결과 JSON 변환
-        res_json = xmltodict.parse(res.text)
+        res = self.transport.get(url, params=params, verify=False, key_pool=self.key_pool)
+        # 요청 결과 파싱
+        parsed = parse_xml(res.content)
         # 응답 키 존재 확인
-        if not res_json.get("response"):
+        if parsed.root != "response":
             if verbose:
-                print(res_json)
+                print(res.text)
             raise Exception("API 요청이 실패했습니다.")
         # 결과코드가 정상이 아닌 경우
-        if res_json['response']['header']['resultCode'] != '00':
-            error_message = res_json['response']['header']['resultMsg']
-            raise Exception(error_message)
-        # 요청 행 수
-        _numOfRows = res_json['response']['body']['numOfRows']
-        # 페이지 번호
-        _pageNo = res_json['response']['body']['pageNo']
-        # 총 데이터 크기
-        _totalCount = res_json['response']['body']['totalCount']
-        # 순회해야 하는 페이지 수
-        _pageNoCount = int(_totalCount) // int(_numOfRows) + 1
-        if verbose:
-            print(
-                f"""- 요청 행 수: {_numOfRows}\n- 현재 페이지 번호: {_pageNo}\n- 총 행 수: {_totalCount}\n- 총 페이지 수: {_pageNoCount}\n- API 요청 대기시간: {wait_time}초""")
-        items = res_json['response']['body']['items']
-        if not items:
-            return pd.DataFrame(columns=columns)
-        data = items['item']
-        if isinstance(data, list):
-            sub = pd.DataFrame(data)
-        elif isinstance(data, dict):
-            sub = pd.DataFrame([data])
-        df = pd.concat([df, sub], axis=0, ignore_index=True)
-        if _pageNoCount > 1:
-            if verbose:
-                print(f"페이지가 {_pageNoCount}개 있습니다.")
-            # 페이지 순회
-            for i in range(2, _pageNoCount + 1):
-                # 다음 페이지 조회 전 대기
-                time.sleep(wait_time)
-                if verbose:
-                    print(f"page {i} / {_pageNoCount} 요청")
-                params['pageNo'] = i
-                # API 요청
-                res = requests.get(url, params=params, verify=False)
-                # 요청 결과 JSON 변환
-                res_json = xmltodict.parse(res.text)
-                # 응답 키 존재 확인
-                if not res_json.get("response"):
-                    if verbose:
-                        print(res_json)
-                    raise Exception("API 요청이 실패했습니다.")
-                # 결과코드가 정상이 아닌 경우
-                if res_json['response']['header']['resultCode'] != '00':
-                    error_message = res_json['response']['header']['resultMsg']
-                    raise Exception(error_message)
-                items = res_json['response']['body']['items']
-                if not items:
-                    return pd.DataFrame(columns=columns)
-                data = items['item']
-                if isinstance(data, list):
-                    sub = pd.DataFrame(data)
-                elif isinstance(data, dict):
-                    sub = pd.DataFrame([data])
-                df = pd.concat([df, sub], axis=0, ignore_index=True)
-        # 컬럼명 한글로 변경
-        if translate:
-            df = self.translate_columns(df)
-        return df
+        if parsed.result_code != '00':
+            raise Exception(parsed.result_msg)
+        return parsed.body, parsed.columns
 
     def translate_columns(self, df):
         """
@@ -557,6 +1204,33 @@ class BuildingLedger:
 # (Deprecated Class)
 
 
+def _probe_endpoints(transport, endpoints, timeout, max_workers, logger):
+    """
+    서비스 상태 확인 요청을 동시에 보내고 Endpoint 순서대로 결과 행 목록 반환
+
+    endpoints는 (구분 값 튜플, URL) 목록이며, 결과 행은
+    (구분 값..., 정상여부, 결과코드, 결과메시지, 응답시간) 형식입니다.
+    """
+    def check(endpoint):
+        labels, url = endpoint
+        start = time.perf_counter()
+        try:
+            res = transport.probe(url, timeout=timeout, verify=False)
+            parsed = parse_xml(res.content)
+            result_code, result_msg = parsed.result_code, parsed.result_msg
+        except Exception as e:
+            result_code, result_msg = None, str(e)
+        elapsed = round(time.perf_counter() - start, 3)
+        name = " ".join(labels)
+        if result_code == "00":
+            logger.info(f"{name} 조회 서비스 정상 - ({result_code}) {result_msg}")
+        else:
+            logger.error(f"{name} 조회 서비스 오류 - ({result_code}) {result_msg}")
+        return (*labels, result_code == "00", result_code, result_msg, elapsed)
+
+    return list(imap_ordered(check, endpoints, max_workers=max_workers or len(endpoints)))
+
+
 class Transaction:
     """
     (Deprecated) 부동산 실거래가 조회 클래스
@@ -567,9 +1241,12 @@ class Transaction:
     ----------
         serviceKey: 서비스 인증키 문자열
         debug: True이면 모든 로깅 메시지 출력, False이면 에러 로깅 메시지만 출력
+        transport: HTTP 요청 공용 전송 객체 (기본값: 기본 공용 객체)
+
+    인스턴스 생성 시에는 요청을 보내지 않으며, 서비스 정상 작동 여부는 probe 메서드로 확인합니다.
     """
 
-    def __init__(self, serviceKey=None, debug=False):
+    def __init__(self, serviceKey=None, debug=False, transport=None):
         # 로거 설정
         self.logger = logging.getLogger("root")
         # 로깅 레벨 설정
@@ -587,6 +1264,8 @@ class Transaction:
 
         # Open API 서비스 키 초기화
         self.serviceKey = serviceKey
+        # HTTP 요청 공용 전송 객체
+        self.transport = transport or get_transport()
 
         # 메타정보 매핑
         self.metaDict = {
@@ -668,22 +1347,26 @@ class Transaction:
         self.floatCols = ['전용면적', '대지권면적',
                           '대지면적', '연면적', '계약면적', '건물면적', '거래면적']
 
-        # 서비스 정상 작동 여부 확인
-        for prod in self.metaDict.keys():
-            for trans in self.metaDict[prod].keys():
-                # Endpoint
-                url = self.metaDict[prod][trans]['url']
-                result = requests.get(url, verify=False)
-                xmlsoup = BeautifulSoup(result.text, "lxml-xml")
-                header = xmlsoup.find('header')
-                result_code = header.find('resultCode').text
-                result_msg = header.find('resultMsg').text
-                if result_code == "00":
-                    self.logger.info(
-                        f"{prod} {trans} 조회 서비스 정상 - ({result_code}) {result_msg}")
-                else:
-                    self.logger.error(
-                        f"{prod} {trans} 조회 서비스 오류 - ({result_code}) {result_msg}")
+    def probe(self, timeout=5, max_workers=None):
+        """
+        서비스 정상 작동 여부 확인
+
+        모든 부동산 유형, 거래 유형의 Endpoint에 동시에 요청을 보내고 결과를 표로 반환합니다.
+        재시도 없이 한 번만 요청하며, 오류는 로깅 메시지로도 출력합니다.
+
+        parameters
+        ----------
+            timeout: Endpoint별 요청 타임아웃(초) (기본값: 5)
+            max_workers: 동시에 보낼 요청 수 (기본값: None, 전체 Endpoint 수)
+
+        returns
+        -------
+            DataFrame: 부동산유형, 거래구분, 정상여부, 결과코드, 결과메시지, 응답시간 컬럼
+        """
+        endpoints = [((prod, trans), self.metaDict[prod][trans]['url'])
+                     for prod in self.metaDict for trans in self.metaDict[prod]]
+        rows = _probe_endpoints(self.transport, endpoints, timeout, max_workers, self.logger)
+        return pd.DataFrame(rows, columns=["부동산유형", "거래구분", "정상여부", "결과코드", "결과메시지", "응답시간"])
 
     def collect_data(self, prod, trans, sigunguCode, startYearMonth, endYearMonth):
         """
@@ -704,18 +1387,22 @@ class Transaction:
         end_date = datetime.datetime.strftime(end_date, "%Y-%m")
         ts = pd.date_range(start=start_date, end=end_date, freq="m")
         date_list = list(ts.strftime("%Y%m"))
-        df = pd.DataFrame()
+        frames = [pd.DataFrame()]
         for yearMonth in date_list:
             try:
                 _info_message = f"{prod} {trans} {yearMonth} 조회 시작"
                 self.logger.info(_info_message)
                 df_ = self.read_data(prod, trans, sigunguCode, yearMonth)
-                df = pd.concat([df, df_], axis=0).reset_index(drop=True)
+                # 월별 조회 오류 시 read_data는 오류 메시지를 반환
+                if not isinstance(df_, pd.DataFrame):
+                    raise ValueError(df_)
+                frames.append(df_)
             except:
                 _error_message = f"{prod} {trans} {yearMonth} 조회 오류"
                 self.logger.error(_error_message)
                 return _error_message
-        return df
+        # 월별 결과를 마지막에 한 번만 합침
+        return pd.concat(frames, axis=0).reset_index(drop=True)
 
     def read_data(self, prod, trans, sigunguCode, yearMonth):
         """
@@ -741,12 +1428,10 @@ class Transaction:
             # URL
             url = f"""{endpoint}&LAWD_CD={str(sigunguCode)}&DEAL_YMD={str(yearMonth)}&numOfRows=99999"""
             # Open API 호출
-            result = requests.get(url, verify=False)
-            xmlsoup = BeautifulSoup(result.text, "lxml-xml")
-            header = xmlsoup.find("header")
-            result_code = header.find("resultCode").text
-            result_msg = header.find("resultMsg").text
-            items = xmlsoup.findAll("item")
+            result = self.transport.get(url, verify=False)
+            parsed = parse_xml(result.content)
+            result_code = parsed.header["resultCode"] or ""
+            result_msg = parsed.header["resultMsg"] or ""
 
         except:
             _error_message = f"HTTP 요청 혹은 파싱 오류"
@@ -759,25 +1444,14 @@ class Transaction:
             """
             # 데이터프레임 생성
             try:
-                df = pd.DataFrame(columns=columns)
-                for item in items:
-                    row = {}
-                    for col in columns:
-                        try:
-                            tag = item.find(col)
-                            row[col] = tag.text.strip()
-                        except:
-                            row[col] = ""
-                    df_ = pd.DataFrame([row])[columns]
-                    df = pd.concat([df, df_], axis=0).reset_index(drop=True)
-
-                for col in self.integerCols:
-                    if col in df.columns:
-                        df[col] = pd.to_numeric(df[col].apply(
-                            lambda x: x.strip().replace(",", ""))).astype("Int64")
-                for col in self.floatCols:
-                    if col in df.columns:
-                        df[col] = pd.to_numeric(df[col])
+                # 컬럼 목록에 있는 값만 사용하고, 없거나 빈 값은 빈 문자열로 채움
+                builder = FrameBuilder(columns)
+                builder.add_columns(parsed.select(columns))
+                df = builder.build()
+
+                schema = {col: INTEGER for col in self.integerCols}
+                schema.update({col: FLOAT for col in self.floatCols})
+                df = coerce_frame(df, schema)
 
                 return df
 
@@ -805,9 +1479,12 @@ class Building:
     ----------
         serviceKey: 서비스 인증키 문자열
         debug: True이면 모든 로깅 메시지 출력, False이면 에러 로깅 메시지만 출력
+        transport: HTTP 요청 공용 전송 객체 (기본값: 기본 공용 객체)
+
+    인스턴스 생성 시에는 요청을 보내지 않으며, 서비스 정상 작동 여부는 probe 메서드로 확인합니다.
     """
 
-    def __init__(self, serviceKey=None, debug=False):
+    def __init__(self, serviceKey=None, debug=False, transport=None):
         # 로거 설정
         self.logger = logging.getLogger("root")
         # 로깅 레벨 설정
@@ -825,6 +1502,8 @@ class Building:
 
         # Open API 서비스 키 초기화
         self.serviceKey = serviceKey
+        # HTTP 요청 공용 전송 객체
+        self.transport = transport or get_transport()
 
         # 메타정보 매핑
         self.metaDict = {
@@ -891,20 +1570,25 @@ class Building:
 
         }
 
-        for category in self.metaDict.keys():
-            # Endpoint
-            url = self.metaDict[category]['url']
-            result = requests.get(url, verify=False)
-            xmlsoup = BeautifulSoup(result.text, "lxml-xml")
-            header = xmlsoup.find('header')
-            result_code = header.find('resultCode').text
-            result_msg = header.find('resultMsg').text
-            if result_code == "00":
-                self.logger.info(
-                    f"{category} 조회 서비스 정상 - ({result_code}) {result_msg}")
-            else:
-                self.logger.err(
-                    f"{category} 조회 서비스 오류 - ({result_code}) {result_msg}")
+    def probe(self, timeout=5, max_workers=None):
+        """
+        서비스 정상 작동 여부 확인
+
+        모든 오퍼레이션의 Endpoint에 동시에 요청을 보내고 결과를 표로 반환합니다.
+        재시도 없이 한 번만 요청하며, 오류는 로깅 메시지로도 출력합니다.
+
+        parameters
+        ----------
+            timeout: Endpoint별 요청 타임아웃(초) (기본값: 5)
+            max_workers: 동시에 보낼 요청 수 (기본값: None, 전체 Endpoint 수)
+
+        returns
+        -------
+            DataFrame: 오퍼레이션, 정상여부, 결과코드, 결과메시지, 응답시간 컬럼
+        """
+        endpoints = [((category,), self.metaDict[category]['url']) for category in self.metaDict]
+        rows = _probe_endpoints(self.transport, endpoints, timeout, max_workers, self.logger)
+        return pd.DataFrame(rows, columns=["오퍼레이션", "정상여부", "결과코드", "결과메시지", "응답시간"])
 
     def read_data(self, category, **kwargs):
         """
@@ -939,12 +1623,10 @@ class Building:
             url = f"""{endpoint}{params}&numOfRows=99999"""
 
             # Open API 호출
-            result = requests.get(url, verify=False)
-            xmlsoup = BeautifulSoup(result.text, "lxml-xml")
-            header = xmlsoup.find("header")
-            result_code = header.find("resultCode").text
-            result_msg = header.find("resultMsg").text
-            items = xmlsoup.findAll("item")
+            result = self.transport.get(url, verify=False)
+            parsed = parse_xml(result.content)
+            result_code = parsed.header["resultCode"] or ""
+            result_msg = parsed.header["resultMsg"] or ""
 
         except:
             _error_message = f"HTTP 요청 혹은 파싱 오류"
@@ -957,17 +1639,10 @@ class Building:
             """
             # 데이터프레임 생성
             try:
-                df = pd.DataFrame(columns=columns)
-                for item in items:
-                    row = {}
-                    for col in columns:
-                        try:
-                            tag = item.find(col)
-                            row[col] = tag.text.strip()
-                        except:
-                            row[col] = ""
-                    df_ = pd.DataFrame([row])[columns]
-                    df = pd.concat([df, df_], axis=0).reset_index(drop=True)
+                # 컬럼 목록에 있는 값만 사용하고, 없거나 빈 값은 빈 문자열로 채움
+                builder = FrameBuilder(columns)
+                builder.add_columns(parsed.select(columns))
+                df = builder.build()
                 df = self.ChangeCols(df, category)
                 return df
 
@@ -1,15 +1,24 @@
-import requests
 import pandas as pd
-import urllib.parse
+from ..utils.transport import get_transport
+from ..utils.keypool import ServiceKeyPool
 
 
 class Nts:
     """
     NTS Open API 클래스
+
+    parameters
+    ----------
+    service_key : str, list
+        공공 데이터 포털 Open API 서비스키 (여러 개의 서비스키 목록 또는 ServiceKeyPool도 가능)
+    transport : Transport, optional
+        HTTP 요청 공용 전송 객체, by default None (기본 공용 객체 사용)
     """
 
-    def __init__(self, service_key=None):
+    def __init__(self, service_key=None, transport=None):
         self.serviceKey = service_key
+        self.key_pool = ServiceKeyPool.from_value(service_key)
+        self.transport = transport or get_transport()
         self.url_dict = {
             "진위확인": "https://api.odcloud.kr/api/nts-businessman/v1/validate",
             "상태조회": "https://api.odcloud.kr/api/nts-businessman/v1/status",
@@ -30,16 +39,14 @@ class Nts:
             진위확인 결과
         """
         url = self.url_dict["진위확인"]
-        params = {
-            "serviceKey": urllib.parse.unquote(self.serviceKey),
-        }
+        params = {}
         if type(businesses) == pd.DataFrame:
             businesses = businesses.to_dict("records")
         json_data = {
             "businesses": businesses,
         }
         try:
-            response = requests.post(url, params=params, json=json_data, verify=False)
+            response = self.transport.post(url, params=params, json=json_data, verify=False, key_pool=self.key_pool)
             df = pd.json_normalize(response.json()['data'])
         except Exception as e:
             print("Error")
@@ -62,14 +69,12 @@ class Nts:
             상태조회 결과
         """
         url = self.url_dict["상태조회"]
-        params = {
-            "serviceKey": urllib.parse.unquote(self.serviceKey),
-        }
+        params = {}
         data = {
             "b_no": b_no,
         }
         try:
-            response = requests.post(url, params=params, json=data, verify=False)
+            response = self.transport.post(url, params=params, json=data, verify=False, key_pool=self.key_pool)
             df = pd.DataFrame(response.json()['data'])
         except Exception as e:
             print("Error")
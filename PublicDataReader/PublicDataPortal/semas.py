@@ -22,18 +22,33 @@ semas(Small Enterprise And Market Service)
     17.상권정보 업종 소분류 조회
 """
 import pandas as pd
+import datetime
 import logging
-import requests
-import xmltodict
-import urllib.parse
-from bs4 import BeautifulSoup
+from ..utils.transport import get_transport
+from ..utils.keypool import ServiceKeyPool
+from ..utils.concurrency import imap_ordered
+from ..utils.frame import FrameBuilder
+from ..utils.parser import parse_xml
+from ..utils.coerce import compact_frame, CATEGORY
 
 
 class SmallShop:
+    """
+    소상공인시장진흥공단 상가(상권)정보 조회 클래스
+
+    parameters
+    ----------
+    service_key : str, list
+        공공 데이터 포털 Open API 서비스키 (여러 개의 서비스키 목록 또는 ServiceKeyPool도 가능)
+    transport : Transport, optional
+        HTTP 요청 공용 전송 객체, by default None (기본 공용 객체 사용)
+    """
 
-    def __init__(self, service_key=None):
+    def __init__(self, service_key=None, transport=None):
 
         self.serviceKey = service_key
+        self.key_pool = ServiceKeyPool.from_value(service_key)
+        self.transport = transport or get_transport()
         self.meta_dict = {
             "지정상권": {
                 "url": f"http://apis.data.go.kr/B553077/api/open/sdsc/storeZoneOne",
@@ -104,6 +119,15 @@ class SmallShop:
                 "columns": ['indsLclsCd', 'indsLclsNm', 'indsMclsCd', 'indsMclsNm', 'indsSclsCd', 'indsSclsNm', 'stdrDt'],
             },
         }
+        # compact=True 일 때 사용할 컬럼 타입 (경도, 위도는 정밀도를 위해 float64 사용)
+        self.compact_schema = {
+            'lon': 'float64', 'lat': 'float64', 'trarArea': 'float32', 'coordNum': 'Int32',
+            **{col: CATEGORY for col in [
+                'indsLclsCd', 'indsLclsNm', 'indsMclsCd', 'indsMclsNm', 'indsSclsCd', 'indsSclsNm',
+                'ksicCd', 'ksicNm', 'ctprvnCd', 'ctprvnNm', 'signguCd', 'signguNm', 'adongCd',
+                'adongNm', 'ldongCd', 'ldongNm', 'plotSctCd', 'plotSctNm', 'rdnmCd', 'rdnm',
+                'oldZipcd', 'newZipcd', 'dongNo', 'flrNo', 'hoNo', 'mainTrarNm', 'stdrDt']},
+        }
 
     def get_data(self,
                  service_name,
@@ -118,8 +142,32 @@ class SmallShop:
                  maxy=None,
                  translate=True,
                  verbose=False,
+                 compact=False,
+                 max_workers=4,
                  **kwargs
                  ):
+        """
+        상가(상권)정보 조회
+
+        첫 페이지의 totalCount로 페이지 수를 계산해 나머지 페이지를 동시에 요청하고
+        페이지 순서대로 합친 전체 결과를 반환합니다.
+
+        Parameters
+        ----------
+        service_name : str
+            서비스명 (ex. 지정상권, 반경상권, 사각형상권, 행정동상가, 업종별상가 등)
+        translate : bool
+            한글 컬럼명으로 변환 여부 (기본값: True)
+        verbose : bool
+            진행 상황 출력 여부 (기본값: False)
+        compact : bool
+            메모리를 적게 사용하는 컬럼 타입으로 변환 여부 (기본값: False)
+            코드, 이름 컬럼은 범주형, 경도와 위도는 실수형으로 변환합니다.
+        max_workers : int
+            나머지 페이지를 동시에 요청할 수 (기본값: 4)
+        **kwargs : dict
+            API 요청에 필요한 추가 인자 (key, divId, radius, cx, cy, minx, miny, maxx, maxy 등)
+        """
         try:
             # 서비스명으로 API URL 선택 (ex. 지정상권, 반경상권, 사각형상권 등)
             url = self.meta_dict.get(service_name).get("url")
@@ -129,7 +177,6 @@ class SmallShop:
             raise AttributeError("서비스명을 확인해주세요.")
         # 서비스키, 행수, 시군구코드, 법정동코드 설정
         params = {
-            "serviceKey": urllib.parse.unquote(self.serviceKey),
             "pageNo": 1,
             "numOfRows": 99999,
             "key": key,
@@ -144,42 +191,201 @@ class SmallShop:
         }
         # 선택 파라미터 추가 설정
         params.update(kwargs)
-        # 빈 데이터 프레임 생성
-        df = pd.DataFrame(columns=columns)
-        # API 요청
-        res = requests.get(url, params=params, verify=False)
-        # 요청 결과 JSON 변환
-        res_json = xmltodict.parse(res.text)
-        # 응답 키 존재 확인
-        if not res_json.get("response"):
+        # 첫 페이지 요청
+        parsed = self._get_page(url, params, verbose)
+        if parsed is None or not parsed.count:
             if verbose:
-                print(res_json)
-            raise Exception("API 요청이 실패했습니다.")
-        # 결과코드가 정상이 아닌 경우
-        if res_json['response']['header']['resultCode'] != '00':
-            if res_json['response']['header']['resultCode'] == '03':
-                if verbose:
-                    print("조회 결과가 없습니다.")
-                return pd.DataFrame(columns=columns)
-            else:
-                error_message = res_json['response']['header']['resultMsg']
-                raise Exception(error_message)
-        items = res_json['response']['body']['items']
-        if not items:
+                print("조회 결과가 없습니다.")
             return pd.DataFrame(columns=columns)
-        data = items['item']
-        if isinstance(data, list):
-            sub = pd.DataFrame(data)
-        elif isinstance(data, dict):
-            sub = pd.DataFrame([data])
-        df = pd.concat([df, sub], axis=0, ignore_index=True)
-        if len(df) >= 99999:
-            print("행수가 99999개를 초과했습니다. 다음 페이지를 조회하세요.")
+        builder = FrameBuilder(columns)
+        builder.add_columns(parsed.columns)
+        # 총 행 수로 나머지 페이지 계산 (totalCount가 없는 서비스는 첫 페이지만 사용)
+        body = parsed.body or {}
+        page_no = int(params["pageNo"])
+        num_of_rows = int(body.get("numOfRows") or params["numOfRows"])
+        total_count = int(body.get("totalCount") or 0)
+        page_count = -(-total_count // num_of_rows)
+        if verbose and page_count > page_no:
+            print(f"총 {total_count}행, {page_count - page_no + 1}개 페이지를 조회합니다.")
+
+        def fetch(page):
+            if verbose:
+                print(f"page {page} 요청")
+            return self._get_page(url, dict(params, pageNo=page), verbose)
+
+        pages = range(page_no + 1, page_count + 1)
+        for parsed in imap_ordered(fetch, pages, max_workers=max_workers):
+            if parsed is not None:
+                builder.add_columns(parsed.columns)
+        df = builder.build()
+        if compact:
+            df = compact_frame(df, self.compact_schema)
         # 컬럼명 한글로 변경
         if translate:
             df = self.translate_columns(df)
         return df
 
+    def get_tiled_data(self,
+                       service_name,
+                       minx,
+                       miny,
+                       maxx,
+                       maxy,
+                       threshold=1000,
+                       max_depth=8,
+                       translate=True,
+                       verbose=False,
+                       compact=False,
+                       max_workers=8,
+                       **kwargs
+                       ):
+        """
+        넓은 사각형 영역의 상가(상권)정보 분할 조회
+
+        사각형을 4개의 작은 사각형으로 반복해서 나누어(쿼드트리) 사각형마다 조회 결과가
+        threshold개 이하가 되도록 조회합니다. 같은 깊이의 사각형은 동시에 요청하고,
+        경계에 걸쳐 여러 사각형에서 조회된 상가업소(상권)는 하나만 남깁니다.
+
+        Parameters
+        ----------
+        service_name : str
+            서비스명 (사각형상가, 사각형상권)
+        minx, miny, maxx, maxy : float
+            조회할 사각형의 최소 경도, 최소 위도, 최대 경도, 최대 위도
+        threshold : int
+            사각형 하나에서 조회할 최대 행 수이자 요청 행 수 (기본값: 1000)
+        max_depth : int
+            사각형을 나누는 최대 깊이 (기본값: 8)
+            최대 깊이의 사각형은 더 나누지 않고 나머지 페이지를 순서대로 조회합니다.
+        translate : bool
+            한글 컬럼명으로 변환 여부 (기본값: True)
+        verbose : bool
+            진행 상황 출력 여부 (기본값: False)
+        compact : bool
+            메모리를 적게 사용하는 컬럼 타입으로 변환 여부 (기본값: False)
+        max_workers : int
+            동시에 요청할 사각형 수 (기본값: 8)
+        **kwargs : dict
+            API 요청에 필요한 추가 인자 (indsLclsCd, indsMclsCd, indsSclsCd 등)
+        """
+        # 서비스별 중복 제거 기준 컬럼
+        id_columns = {"사각형상가": "bizesId", "사각형상권": "trarNo"}
+        if service_name not in id_columns:
+            raise AttributeError("서비스명을 확인해주세요. (사각형상가, 사각형상권)")
+        url = self.meta_dict[service_name]["url"]
+        columns = self.meta_dict[service_name]["columns"]
+        params = dict(kwargs, pageNo=1, numOfRows=threshold)
+
+        def fetch(tile):
+            x0, y0, x1, y1, depth = tile
+            tile_params = dict(params, minx=x0, miny=y0, maxx=x1, maxy=y1)
+            parsed = self._get_page(url, tile_params, verbose)
+            if parsed is None or not parsed.count:
+                return 0, []
+            total_count = int((parsed.body or {}).get("totalCount") or 0)
+            if total_count > threshold and depth < max_depth:
+                # 더 나눌 사각형은 첫 페이지 결과를 사용하지 않음
+                return total_count, None
+            pages = [parsed.columns]
+            for page in range(2, -(-total_count // threshold) + 1):
+                parsed = self._get_page(url, dict(tile_params, pageNo=page), verbose)
+                if parsed is not None:
+                    pages.append(parsed.columns)
+            return total_count, pages
+
+        builder = FrameBuilder(columns)
+        tiles = [(float(minx), float(miny), float(maxx), float(maxy), 0)]
+        while tiles:
+            if verbose:
+                print(f"깊이 {tiles[0][4]}: 사각형 {len(tiles)}개 요청")
+            next_tiles = []
+            for tile, (total_count, pages) in zip(tiles, imap_ordered(fetch, tiles, max_workers=max_workers)):
+                if pages is None:
+                    x0, y0, x1, y1, depth = tile
+                    cx, cy = (x0 + x1) / 2, (y0 + y1) / 2
+                    next_tiles += [(x0, y0, cx, cy, depth + 1), (cx, y0, x1, cy, depth + 1),
+                                   (x0, cy, cx, y1, depth + 1), (cx, cy, x1, y1, depth + 1)]
+                    continue
+                for data in pages:
+                    builder.add_columns(data)
+            tiles = next_tiles
+        df = builder.build()
+        # 사각형 경계에서 중복 조회된 행 제거
+        df = df.drop_duplicates(subset=id_columns[service_name], ignore_index=True)
+        if compact:
+            df = compact_frame(df, self.compact_schema)
+        # 컬럼명 한글로 변경
+        if translate:
+            df = self.translate_columns(df)
+        return df
+
+    def sync(self,
+             store,
+             start_date=None,
+             max_workers=4,
+             verbose=False,
+             **kwargs):
+        """
+        상가업소 로컬 저장소 동기화
+
+        수정일자기준 상가업소 조회(수정일자상가)로 저장소의 기준일(watermark) 이후
+        수정된 상가업소만 요청하고, 상가업소번호(bizesId) 기준으로 저장소에 반영합니다.
+        반영한 뒤에는 요청을 시작한 날짜를 다음 기준일로 기록합니다.
+
+        Parameters
+        ----------
+        store : TableStore
+            상가업소 테이블 저장소 (key="bizesId", 영문 컬럼명으로 저장)
+        start_date : str, optional
+            저장소에 기준일이 없을 때 사용할 기준일 (ex. 20230101), by default None
+        max_workers : int, optional
+            페이지를 동시에 요청할 수, by default 4
+        verbose : bool, optional
+            진행 상황 출력 여부, by default False
+        **kwargs : dict
+            API 요청에 필요한 추가 인자 (indsLclsCd 등)
+            조건을 바꾸면 기준일이 맞지 않으므로 조건마다 다른 저장소를 사용합니다.
+
+        Returns
+        -------
+        DataFrame
+            동기화 결과 (기준일자, 동기화일자, 건수, 추가, 변경)
+        """
+        since = store.watermark or start_date
+        if since is None:
+            raise ValueError("저장소에 기준일이 없습니다. start_date를 입력해주세요.")
+        # 요청 중에 수정된 자료를 놓치지 않도록 요청 전 날짜를 다음 기준일로 사용
+        today = datetime.date.today().strftime("%Y%m%d")
+        if verbose:
+            print(f"{since} 이후 수정된 상가업소 요청")
+        df = self.get_data("수정일자상가", key=since, translate=False, verbose=verbose,
+                           max_workers=max_workers, **kwargs)
+        inserted, updated = store.upsert(df, watermark=today)
+        return pd.DataFrame([[since, today, len(df), inserted, updated]],
+                            columns=["기준일자", "동기화일자", "건수", "추가", "변경"])
+
+    def _get_page(self, url, params, verbose=False):
+        """
+        상가(상권)정보 한 페이지 요청
+
+        파싱 결과(XmlResponse)를 반환하며, 조회 결과가 없으면(결과코드 03) None을 반환합니다.
+        """
+        # API 요청
+        res = self.transport.get(url, params=params, verify=False, key_pool=self.key_pool)
+        # 요청 결과 파싱
+        parsed = parse_xml(res.content)
+        # 응답 키 존재 확인
+        if parsed.root != "response":
+            if verbose:
+                print(res.text)
+            raise Exception("API 요청이 실패했습니다.")
+        # 결과코드가 정상이 아닌 경우
+        if parsed.result_code != '00':
+            if parsed.result_code == '03':
+                return None
+            raise Exception(parsed.result_msg)
+        return parsed
+
     def translate_columns(self, df):
         """
         영문 컬럼명을 한글로 변경
@@ -247,9 +453,10 @@ class StoreInfo:
     ----------
         serviceKey: 서비스 인증키 문자열
         debug: True이면 모든 로깅 메시지 출력, False이면 에러 로깅 메시지만 출력
+        transport: HTTP 요청 공용 전송 객체 (기본값: 기본 공용 객체)
     """
 
-    def __init__(self, serviceKey=None, debug=False):
+    def __init__(self, serviceKey=None, debug=False, transport=None):
         # 로거 설정
         self.logger = logging.getLogger("root")
         # 로깅 레벨 설정
@@ -267,6 +474,8 @@ class StoreInfo:
 
         # OpenAPI 서비스 키 초기화
         self.serviceKey = serviceKey
+        # HTTP 요청 공용 전송 객체
+        self.transport = transport or get_transport()
 
         # ServiceKey 등록
         self.endpoint = f"http://apis.data.go.kr/B553077/api/open/sdsc/"
@@ -393,12 +602,10 @@ class StoreInfo:
             url = f"""{endpoint}{params}&numOfRows=99999"""
 
             # OpenAPI 호출
-            result = requests.get(url, verify=False)
-            xmlsoup = BeautifulSoup(result.text, "lxml-xml")
-            header = xmlsoup.find("header")
-            result_code = header.find("resultCode").text
-            result_msg = header.find("resultMsg").text
-            items = xmlsoup.findAll("item")
+            result = self.transport.get(url, verify=False)
+            parsed = parse_xml(result.content)
+            result_code = parsed.header["resultCode"] or ""
+            result_msg = parsed.header["resultMsg"] or ""
 
         except:
             _error_message = f"HTTP 요청 혹은 파싱 오류"
@@ -411,17 +618,10 @@ class StoreInfo:
             """
             # 데이터프레임 생성
             try:
-                df = pd.DataFrame(columns=columns)
-                for item in items:
-                    row = {}
-                    for col in columns:
-                        try:
-                            tag = item.find(col)
-                            row[col] = tag.text.strip()
-                        except:
-                            row[col] = ""
-                    df_ = pd.DataFrame([row])[columns]
-                    df = pd.concat([df, df_], axis=0).reset_index(drop=True)
+                # 컬럼 목록에 있는 값만 사용하고, 없거나 빈 값은 빈 문자열로 채움
+                builder = FrameBuilder(columns)
+                builder.add_columns(parsed.select(columns))
+                df = builder.build()
                 df = self.ChangeCols(df)
                 return df
 
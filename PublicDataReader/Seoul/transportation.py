@@ -6,11 +6,24 @@
     02.서울시 버스노선별 정류장별 승하차 인원 정보
 """
 
+import json
 import pandas as pd
 import datetime
 import logging
-import requests
 from bs4 import BeautifulSoup
+from ..utils.transport import get_transport
+from ..utils.concurrency import imap_ordered
+from ..utils.frame import FrameBuilder
+from ..utils.coerce import coerce_frame, INTEGER, DATE
+
+
+def _to_text(value):
+    # JSON 숫자 값을 XML 응답과 같은 문자열로 변환 (ex. 1234.0 -> "1234")
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value).strip()
 
 
 class Transportation:
@@ -23,9 +36,12 @@ class Transportation:
     ----------
         serviceKey: 서비스 인증키 문자열
         debug: True이면 모든 로깅 메시지 출력, False이면 에러 로깅 메시지만 출력
+        transport: HTTP 요청 공용 전송 객체 (기본값: 기본 공용 객체)
+        dataType: 응답 형식 (json, xml) (기본값: json)
+            json 응답이 더 작고 빠르게 변환되며, 두 형식의 결과는 같습니다.
     """
 
-    def __init__(self, serviceKey, debug=False):
+    def __init__(self, serviceKey, debug=False, transport=None, dataType="json"):
         # 로거 설정
         self.logger = logging.getLogger("root")
         # 로깅 레벨 설정
@@ -43,6 +59,12 @@ class Transportation:
 
         # OpenAPI 서비스 키 초기화
         self.serviceKey = serviceKey
+        # HTTP 요청 공용 전송 객체
+        self.transport = transport or get_transport()
+        # 응답 형식
+        if dataType not in ("json", "xml"):
+            raise ValueError("dataType은 json 또는 xml만 가능합니다.")
+        self.dataType = dataType
 
         # ServiceKey 등록
         self.endpoint = f"http://openapi.seoul.go.kr:8088/"
@@ -51,20 +73,36 @@ class Transportation:
         self.metaDict = {
 
             "지하철승하차": {
-                "url": f"{self.endpoint}{self.serviceKey}/xml/CardSubwayStatsNew/",
+                "url": f"{self.endpoint}{self.serviceKey}/{self.dataType}/CardSubwayStatsNew/",
                 "columns": ["USE_DT", "LINE_NUM", "SUB_STA_NM", "RIDE_PASGR_NUM", "ALIGHT_PASGR_NUM", "WORK_DT"]
             },
 
             "버스승하차": {
-                "url": f"{self.endpoint}{self.serviceKey}/xml/CardBusStatisticsServiceNew/",
+                "url": f"{self.endpoint}{self.serviceKey}/{self.dataType}/CardBusStatisticsServiceNew/",
                 "columns": ['USE_DT', 'BUS_ROUTE_ID', 'BUS_ROUTE_NO', 'BUS_ROUTE_NM', 'STND_BSST_ID', 'BSST_ARS_NO', 'BUS_STA_NM', 'RIDE_PASGR_NUM', 'ALIGHT_PASGR_NUM', 'WORK_DT']
             },
 
         }
 
-    def read_data(self, category, **kwargs):
+        # 기간 조회(collect_data) 결과의 컬럼 타입
+        self.typeDict = {
+            "USE_DT": (DATE, "%Y%m%d"),
+            "RIDE_PASGR_NUM": INTEGER,
+            "ALIGHT_PASGR_NUM": INTEGER,
+        }
+
+    def read_data(self, category, max_workers=4, **kwargs):
         """
         데이터 조회
+
+        첫 번째 요청의 전체 행 수(list_total_count)로 나머지 1,000행 단위 구간을
+        미리 계산하여 동시에 요청하고, 결과는 구간 순서대로 합칩니다.
+
+        parameters
+        ----------
+            category: 오퍼레이션 종류 (ex. 지하철승하차, 버스승하차)
+            max_workers: 동시에 요청할 구간 수 (기본값: 4, 1이면 순차 요청)
+            **kwargs: URL 경로에 순서대로 추가할 요청 인자 (ex. date="20211001")
         """
 
         # 엔드포인트, 파라미터 및 컬럼 목록 매핑
@@ -77,62 +115,213 @@ class Transportation:
             return _error_message
 
         try:
-            params = ""
-            for key, value in kwargs.items():
-                params += f"/{value}"
+            pages = list(self._iter_columns(category, max_workers=max_workers, **kwargs))
         except:
-            _error_message = f"{category} 파라미터 파싱 오류"
+            _error_message = f"HTTP 요청 혹은 파싱 오류"
             self.logger.error(_error_message)
             return _error_message
 
+        # 데이터프레임 생성
         try:
-            check_code = "INFO-000"
-            startIdx, endIdx = 1, 1000
-            items = []
-            while check_code == "INFO-000":
-
-                url = f"""{endpoint}{startIdx}/{endIdx}{params}"""
-
-                # OpenAPI 호출
-                result = requests.get(url, verify=False)
-                xmlsoup = BeautifulSoup(result.text, "lxml-xml")
-                header = xmlsoup.find("RESULT")
-                result_code = header.find("CODE").text
-                result_msg = header.find("MESSAGE").text
-                rows = xmlsoup.findAll("row")
-                items = items + rows
-
-                check_code = result_code
-                startIdx += 1000
-                endIdx += 1000
+            builder = FrameBuilder(columns)
+            for data in pages:
+                builder.add_columns(data)
+            df = self.ChangeCols(builder.build())
+            return df
 
         except:
-            _error_message = f"HTTP 요청 혹은 파싱 오류"
+            _error_message = f"전처리 오류"
             self.logger.error(_error_message)
             return _error_message
 
-        # 데이터프레임 생성
+    def collect_data(self, category, startDate, endDate, max_workers=8):
+        """
+        기간별 조회
+
+        사용일자별 요청을 max_workers개까지 동시에 보내고, 결과를 사용일자 순서대로
+        하나의 데이터프레임으로 합칩니다. 사용일자는 날짜형, 승차총승객수와
+        하차총승객수는 정수형(Int64)으로 변환합니다. 결과가 없는 날짜는 건너뜁니다.
+
+        parameters
+        ----------
+            category: 오퍼레이션 종류 (ex. 지하철승하차, 버스승하차)
+            startDate: 조회 시작 사용일자("YYYYmmdd")
+            endDate: 조회 종료 사용일자("YYYYmmdd")
+            max_workers: 동시에 조회할 사용일자 수 (기본값: 8)
+        """
         try:
-            df = pd.DataFrame(columns=columns)
-            for item in items:
-                row = {}
-                for col in columns:
-                    try:
-                        tag = item.find(col)
-                        row[col] = tag.text.strip()
-                    except:
-                        row[col] = ""
-                df_ = pd.DataFrame([row])[columns]
-                df = pd.concat([df, df_], axis=0).reset_index(drop=True)
-
-            df = self.ChangeCols(df)
-            return df
+            columns = self.metaDict[category]['columns']
+        except:
+            _error_message = f"{category} 참조 오류"
+            self.logger.error(_error_message)
+            return _error_message
 
+        try:
+            dates = pd.date_range(start=pd.to_datetime(str(startDate), format="%Y%m%d"),
+                                  end=pd.to_datetime(str(endDate), format="%Y%m%d"), freq="D")
+            dates = list(dates.strftime("%Y%m%d"))
+        except:
+            _error_message = f"{startDate} ~ {endDate} 기간 오류"
+            self.logger.error(_error_message)
+            return _error_message
+
+        def fetch(date):
+            self.logger.info(f"{category} {date} 조회 시작")
+            # 날짜 안의 구간은 순차 요청하여 전체 동시 요청 수를 max_workers로 유지
+            return list(self._iter_columns(category, max_workers=1, date=date))
+
+        builder = FrameBuilder(columns)
+        try:
+            for pages in imap_ordered(fetch, dates, max_workers=max_workers):
+                for data in pages:
+                    builder.add_columns(data)
+        except:
+            _error_message = f"HTTP 요청 혹은 파싱 오류"
+            self.logger.error(_error_message)
+            return _error_message
+
+        try:
+            df = coerce_frame(builder.build(), self.typeDict)
+            return self.ChangeCols(df)
         except:
             _error_message = f"전처리 오류"
             self.logger.error(_error_message)
             return _error_message
 
+    def iter_pages(self, category, max_workers=4, **kwargs):
+        """
+        데이터 조회 제너레이터
+
+        1,000행 단위 응답을 받는 대로 국문 컬럼명의 데이터프레임으로 반환합니다.
+        오류가 발생하면 예외를 발생시킵니다.
+
+        Yields
+        ------
+        DataFrame
+            최대 1,000행의 데이터
+        """
+        columns = self.metaDict[category]['columns']
+        for data in self._iter_columns(category, max_workers=max_workers, **kwargs):
+            builder = FrameBuilder(columns)
+            builder.add_columns(data)
+            yield self.ChangeCols(builder.build())
+
+    def iter_records(self, category, **kwargs):
+        """
+        데이터 행별 조회 제너레이터
+
+        국문 컬럼명을 키로 하는 딕셔너리를 1행씩 반환합니다.
+
+        Yields
+        ------
+        dict
+            데이터 1행
+        """
+        for df in self.iter_pages(category, **kwargs):
+            yield from df.to_dict("records")
+
+    def _iter_columns(self, category, max_workers=1, **kwargs):
+        """
+        1,000행 단위로 요청하여 영문 컬럼명을 키로 하는 컬럼별 값 리스트 반환
+
+        첫 번째 구간 응답의 list_total_count로 나머지 구간을 계산하여 max_workers개까지
+        동시에 요청하고 구간 순서대로 반환합니다. 결과코드가 INFO-000이 아닌 구간에서 멈춥니다.
+        """
+        endpoint = self.metaDict[category]['url']
+        columns = self.metaDict[category]['columns']
+        params = ""
+        for key, value in kwargs.items():
+            params += f"/{value}"
+
+        def fetch(startIdx):
+            return self._get_window(endpoint, columns, startIdx, startIdx + 999, params)
+
+        result_code, total, data = fetch(1)
+        if data:
+            yield data
+        if result_code != "INFO-000":
+            return
+
+        if total is None:
+            # 전체 행 수를 알 수 없으면 결과코드가 정상인 동안 순차 요청
+            startIdx = 1001
+            while result_code == "INFO-000":
+                result_code, _, data = fetch(startIdx)
+                if data:
+                    yield data
+                startIdx += 1000
+            return
+
+        for result_code, _, data in imap_ordered(fetch, range(1001, total + 1, 1000),
+                                                 max_workers=max_workers):
+            if data:
+                yield data
+            if result_code != "INFO-000":
+                break
+
+    def _get_window(self, endpoint, columns, startIdx, endIdx, params=""):
+        """
+        startIdx부터 endIdx까지 요청하여 (결과코드, 전체 행 수, 컬럼별 값 리스트) 반환
+        """
+        url = f"""{endpoint}{startIdx}/{endIdx}{params}"""
+
+        # OpenAPI 호출
+        result = self.transport.get(url, verify=False)
+        # URL의 응답 형식으로 변환 방법 선택 (metaDict의 URL을 직접 바꾼 경우 포함)
+        if "/json/" in endpoint:
+            return self._decode_json(result.content, columns)
+        return self._decode_xml(result.text, columns)
+
+    @staticmethod
+    def _decode_xml(text, columns):
+        """
+        XML 응답을 (결과코드, 전체 행 수, 컬럼별 값 리스트)로 변환 (행이 없으면 빈 딕셔너리)
+        """
+        xmlsoup = BeautifulSoup(text, "lxml-xml")
+        header = xmlsoup.find("RESULT")
+        result_code = header.find("CODE").text
+        total = xmlsoup.find("list_total_count")
+        total = int(total.text) if total is not None else None
+        data = {}
+        items = xmlsoup.findAll("row")
+        if items:
+            rows = [Transportation._parse_row(item, columns) for item in items]
+            data = {col: [row[col] for row in rows] for col in columns}
+        return result_code, total, data
+
+    @staticmethod
+    def _decode_json(content, columns):
+        """
+        JSON 응답을 (결과코드, 전체 행 수, 컬럼별 값 리스트)로 변환 (행이 없으면 빈 딕셔너리)
+
+        XML 응답과 같은 결과가 되도록 값은 앞뒤 공백을 제거한 문자열, 없는 값은 빈 문자열로 변환합니다.
+        """
+        doc = json.loads(content)
+        # 결과가 없거나 오류인 경우 RESULT만 최상위에 있음
+        body = doc if "RESULT" in doc else next(iter(doc.values()))
+        result_code = body["RESULT"]["CODE"]
+        total = body.get("list_total_count")
+        total = int(total) if total is not None else None
+        data = {}
+        rows = body.get("row")
+        if rows:
+            for col in columns:
+                values = [row.get(col) for row in rows]
+                data[col] = [value.strip() if value.__class__ is str else _to_text(value)
+                             for value in values]
+        return result_code, total, data
+
+    @staticmethod
+    def _parse_row(item, columns):
+        row = {}
+        for col in columns:
+            try:
+                tag = item.find(col)
+                row[col] = tag.text.strip()
+            except:
+                row[col] = ""
+        return row
+
     def ChangeCols(self, df):
         """
         영문 컬럼명을 국문 컬럼명으로 변경
@@ -21,6 +21,19 @@ __all__ = [
     "code_bdong",
     "code_hdong",
     "code_hdong_bdong",
+    "get_bdong_codes",
     "get_vworld_data_api_info_by_dataframe",
     "get_vworld_data_api_info_by_dict",
+    "Transport",
+    "get_transport",
+    "set_transport",
+    "RateLimiter",
+    "TokenBucket",
+    "RetryPolicy",
+    "ServiceKeyPool",
+    "ResponseCache",
+    "month_age_ttl",
+    "PartitionStore",
+    "TableStore",
+    "SpatialIndex",
 ]
@@ -27,4 +27,13 @@ from PublicDataReader.PublicDataPortal.nts import Nts
 from PublicDataReader.kbland.kbland import Kbland
 
 # 코드 데이터 조회
-from PublicDataReader.utils.code import code_bdong, code_hdong, code_hdong_bdong, get_vworld_data_api_info_by_dataframe, get_vworld_data_api_info_by_dict
+from PublicDataReader.utils.code import code_bdong, code_hdong, code_hdong_bdong, get_bdong_codes, get_vworld_data_api_info_by_dataframe, get_vworld_data_api_info_by_dict
+
+# HTTP 요청 공용 전송 객체
+from PublicDataReader.utils.transport import Transport, get_transport, set_transport
+from PublicDataReader.utils.ratelimit import RateLimiter, TokenBucket
+from PublicDataReader.utils.retry import RetryPolicy
+from PublicDataReader.utils.keypool import ServiceKeyPool
+from PublicDataReader.utils.cache import ResponseCache, month_age_ttl
+from PublicDataReader.utils.store import PartitionStore, TableStore
+from PublicDataReader.utils.spatial import SpatialIndex
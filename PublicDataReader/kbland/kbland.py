@@ -1,12 +1,21 @@
 """
 KB부동산 데이터 API
 """
-import requests
 import pandas as pd
+from ..utils.transport import get_transport
 
 class Kbland:
+    """
+    KB부동산 데이터 API 클래스
 
-    def __init__(self):
+    Parameters
+    ----------
+    transport : Transport, optional
+        HTTP 요청 공용 전송 객체, by default None (기본 공용 객체 사용)
+    """
+
+    def __init__(self, transport=None):
+        self.transport = transport or get_transport()
         self.월간주간구분코드 = {
             "01": "월간",
             "02": "주간",
@@ -92,7 +101,7 @@ class Kbland:
         }
         params.update(kwargs)
         try:
-            res = requests.get(url, params=params)
+            res = self.transport.get(url, params=params)
             data = res.json()['dataBody']['data']
         except Exception as e:
             print(e)
@@ -139,7 +148,7 @@ class Kbland:
         params = {}
         params.update(kwargs)
         try:
-            res = requests.get(url, params=params)
+            res = self.transport.get(url, params=params)
             data = res.json()['dataBody']['data']
         except Exception as e:
             print(e)
@@ -186,7 +195,7 @@ class Kbland:
         params = {}
         params.update(kwargs)
         try:
-            res = requests.get(url, params=params)
+            res = self.transport.get(url, params=params)
             data = res.json()['dataBody']['data']
         except Exception as e:
             print(e)
@@ -254,7 +263,7 @@ class Kbland:
         }
         params.update(kwargs)
         try:
-            res = requests.get(url, params=params)
+            res = self.transport.get(url, params=params)
             data = res.json()['dataBody']['data']
         except Exception as e:
             print(e)
@@ -314,7 +323,7 @@ class Kbland:
         }
         params.update(kwargs)
         try:
-            res = requests.get(url, params=params)
+            res = self.transport.get(url, params=params)
             data = res.json()['dataBody']['data']
         except Exception as e:
             print(e)
@@ -359,7 +368,7 @@ class Kbland:
         params = {}
         params.update(kwargs)
         try:
-            res = requests.get(url, params=params)
+            res = self.transport.get(url, params=params)
             data = res.json()['dataBody']['data']
         except Exception as e:
             print(e)
@@ -420,7 +429,7 @@ class Kbland:
         }
         params.update(kwargs)
         try:
-            res = requests.get(url, params=params)
+            res = self.transport.get(url, params=params)
             data = res.json()['dataBody']['data']
         except Exception as e:
             print(e)
@@ -501,7 +510,7 @@ class Kbland:
         }
         params.update(kwargs)
         try:
-            res = requests.get(url, params=params)
+            res = self.transport.get(url, params=params)
             data = res.json()['dataBody']['data']
         except Exception as e:
             print(e)
@@ -570,7 +579,7 @@ class Kbland:
         }
         params.update(kwargs)
         try:
-            res = requests.get(url, params=params)
+            res = self.transport.get(url, params=params)
             data = res.json()['dataBody']['data']
         except Exception as e:
             print(e)
@@ -631,7 +640,7 @@ class Kbland:
         }
         params.update(kwargs)
         try:
-            res = requests.get(url, params=params)
+            res = self.transport.get(url, params=params)
             data = res.json()['dataBody']['data']
         except Exception as e:
             print(e)
@@ -692,7 +701,7 @@ class Kbland:
         }
         params.update(kwargs)
         try:
-            res = requests.get(url, params=params)
+            res = self.transport.get(url, params=params)
             data = res.json()['dataBody']['data']
         except Exception as e:
             print(e)
@@ -744,7 +753,7 @@ class Kbland:
         }
         params.update(kwargs)
         try:
-            res = requests.get(url, params=params)
+            res = self.transport.get(url, params=params)
             data = res.json()['dataBody']['data']
         except Exception as e:
             print(e)
@@ -812,7 +821,7 @@ class Kbland:
         }
         params.update(kwargs)
         try:
-            res = requests.get(url, params=params)
+            res = self.transport.get(url, params=params)
             data = res.json()['dataBody']['data']
         except Exception as e:
             print(e)
@@ -870,7 +879,7 @@ class Kbland:
         }
         params.update(kwargs)
         try:
-            res = requests.get(url, params=params)
+            res = self.transport.get(url, params=params)
             data = res.json()['dataBody']['data']
         except Exception as e:
             print(e)
@@ -924,7 +933,7 @@ class Kbland:
         params = {}
         params.update(kwargs)
         try:
-            res = requests.get(url, params=params)
+            res = self.transport.get(url, params=params)
             data = res.json()['dataBody']['data']
         except Exception as e:
             print(e)
@@ -969,7 +978,7 @@ class Kbland:
         params = {}
         params.update(kwargs)
         try:
-            res = requests.get(url, params=params)
+            res = self.transport.get(url, params=params)
             data = res.json()['dataBody']['data']
         except Exception as e:
             print(e)
@@ -998,7 +1007,7 @@ class Kbland:
         params = {}
         params.update(kwargs)
         try:
-            res = requests.get(url, params=params)
+            res = self.transport.get(url, params=params)
             data = res.json()['dataBody']['data']
         except Exception as e:
             print(e)
@@ -1037,7 +1046,7 @@ class Kbland:
         params = {}
         params.update(kwargs)
         try:
-            res = requests.get(url, params=params)
+            res = self.transport.get(url, params=params)
             data = res.json()['dataBody']['data']
         except Exception as e:
             print(e)
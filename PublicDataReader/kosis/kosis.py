@@ -2,8 +2,8 @@
 KOSIS Open API Python Module
 """
 
-import requests
 import pandas as pd
+from ..utils.transport import get_transport
 
 
 class Kosis:
@@ -17,6 +17,8 @@ class Kosis:
         KOSIS 공유서비스에서 발급받은 사용자 인증키
     serviceName : str
         KOSIS 공유서비스 서비스명
+    transport : Transport, optional
+        HTTP 요청 공용 전송 객체, by default None (기본 공용 객체 사용)
 
     Examples
     --------
@@ -27,8 +29,9 @@ class Kosis:
     >>> kosis = pdr.Kosis(apiKey, serviceName)
     """
 
-    def __init__(self, apiKey, serviceName):
+    def __init__(self, apiKey, serviceName, transport=None):
         self.apiKey = apiKey
+        self.transport = transport or get_transport()
         url_dict = {
             "KOSIS통합검색": "https://kosis.kr/openapi/statisticsSearch.do?method=getList",
             "통계설명": "https://kosis.kr/openapi/statisticsExplData.do?method=getList",
@@ -91,7 +94,7 @@ class Kosis:
             return None
 
         try:
-            res = requests.get(self.url, params=kwargs).json()
+            res = self.transport.get(self.url, params=kwargs, key_param="apiKey").json()
         except:
             print("Request Failed!")
             return None
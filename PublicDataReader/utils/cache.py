@@ -0,0 +1,226 @@
+"""
+응답 디스크 캐시 모듈
+
+요청 URL과 파라미터(서비스키 제외)를 키로 HTTP 응답을 디스크에 저장하고,
+유효 기간(TTL) 내에는 네트워크 요청 없이 저장된 응답을 반환합니다.
+"""
+import os
+import re
+import time
+import pickle
+import hashlib
+import datetime
+import tempfile
+import urllib.parse
+import requests
+from requests.structures import CaseInsensitiveDict
+from .retry import get_result_code
+
+
+# KOSIS, Vworld 등 JSON 오류 응답 패턴
+_JSON_ERROR_PATTERN = re.compile(rb'"errMsg"|"status"\s*:\s*"ERROR"')
+
+
+def month_age_ttl(param="DEAL_YMD",
+                  recent_months=3,
+                  recent_ttl=86400,
+                  old_ttl=None,
+                  default_ttl=86400):
+    """
+    조회 연월의 경과 기간에 따라 유효 기간을 정하는 TTL 함수 생성
+
+    최근 연월 자료는 짧게, 오래된 연월 자료는 길게(또는 영구히) 캐시합니다.
+
+    Parameters
+    ----------
+    param : str
+        연월(YYYYMM) 값이 담긴 요청 파라미터 이름 (기본값: "DEAL_YMD")
+    recent_months : int
+        최근 자료로 볼 개월 수 (기본값: 3)
+    recent_ttl : float
+        최근 자료의 유효 기간(초) (기본값: 86400, 1일)
+    old_ttl : float, optional
+        오래된 자료의 유효 기간(초), by default None (만료 없음)
+    default_ttl : float, optional
+        연월 파라미터가 없는 요청의 유효 기간(초), by default 86400
+
+    Examples
+    --------
+    >>> import PublicDataReader as pdr
+    >>> cache = pdr.ResponseCache("./cache", ttl=pdr.month_age_ttl(recent_months=6))
+    """
+    def ttl(url, params):
+        value = str((params or {}).get(param, ""))
+        try:
+            year_month = datetime.datetime.strptime(value[:6], "%Y%m")
+        except ValueError:
+            return default_ttl
+        today = datetime.date.today()
+        age = (today.year - year_month.year) * 12 + (today.month - year_month.month)
+        return recent_ttl if age < recent_months else old_ttl
+    return ttl
+
+
+class ResponseCache:
+    """
+    HTTP 응답 디스크 캐시
+
+    Transport에 설정하면 GET 요청의 정상 응답을 디스크에 저장합니다.
+    캐시 키는 요청 URL과 파라미터로 만들며 서비스키 파라미터는 제외합니다.
+
+    Parameters
+    ----------
+    directory : str
+        캐시 파일 저장 경로
+    ttl : float or callable, optional
+        유효 기간(초) 또는 (url, params)를 입력받아 유효 기간을 반환하는 함수, by default 86400
+        유효 기간이 None이면 만료되지 않습니다.
+    exclude_params : tuple, optional
+        캐시 키에서 제외할 파라미터 이름, by default ("serviceKey", "apiKey")
+
+    Examples
+    --------
+    >>> import PublicDataReader as pdr
+    >>> cache = pdr.ResponseCache("./cache", ttl=pdr.month_age_ttl())
+    >>> transport = pdr.Transport(cache=cache)
+    >>> api = pdr.TransactionPrice(service_key, transport=transport)
+    """
+
+    def __init__(self, directory, ttl=86400, exclude_params=("serviceKey", "apiKey")):
+        self.directory = os.path.expanduser(directory)
+        self.ttl = ttl
+        self.exclude_params = tuple(exclude_params)
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _strip_url(self, url, exclude=()):
+        """
+        URL 쿼리 문자열에서 제외할 파라미터(서비스키)를 제거
+
+        Deprecated 클래스처럼 서비스키를 URL에 직접 넣어 요청하는 경우에도
+        캐시 키와 저장 파일에 서비스키가 남지 않도록 합니다.
+
+        Returns
+        -------
+        tuple
+            (서비스키를 제거한 URL, 제거한 값 목록)
+        """
+        exclude = set(self.exclude_params) | set(exclude)
+        parts = urllib.parse.urlsplit(url)
+        if not parts.query:
+            return url, []
+        query = urllib.parse.parse_qsl(parts.query, keep_blank_values=True)
+        removed = [value for name, value in query if name in exclude]
+        if not removed:
+            return url, []
+        query = urllib.parse.urlencode([(name, value) for name, value in query if name not in exclude])
+        return urllib.parse.urlunsplit(parts._replace(query=query)), removed
+
+    def make_key(self, method, url, params=None, exclude=()):
+        """
+        캐시 키 생성 (서비스키 제외)
+        """
+        exclude = set(self.exclude_params) | set(exclude)
+        url, _ = self._strip_url(url, exclude)
+        items = sorted((str(k), str(v)) for k, v in (params or {}).items()
+                       if k not in exclude and v is not None)
+        raw = repr((method.upper(), url, items)).encode("utf-8")
+        return hashlib.sha256(raw).hexdigest()
+
+    def _get_path(self, key):
+        return os.path.join(self.directory, key[:2], key)
+
+    def _get_ttl(self, url, params):
+        if callable(self.ttl):
+            return self.ttl(url, params)
+        return self.ttl
+
+    def get(self, method, url, params=None, exclude=()):
+        """
+        저장된 응답 반환 (없거나 만료되었으면 None)
+        """
+        path = self._get_path(self.make_key(method, url, params, exclude))
+        try:
+            with open(path, "rb") as f:
+                data = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+        if data["expires"] is not None and data["expires"] < time.time():
+            return None
+        response = requests.Response()
+        response.status_code = data["status_code"]
+        response.reason = data["reason"]
+        response.headers = CaseInsensitiveDict(data["headers"])
+        response.encoding = data["encoding"]
+        response.url = data["url"]
+        response._content = data["content"]
+        response.from_cache = True
+        response.attempts = 0
+        return response
+
+    def is_cacheable(self, response):
+        """
+        정상 응답 여부 (오류 응답은 저장하지 않음)
+        """
+        if response.status_code != 200:
+            return False
+        if get_result_code(response) not in (None, "00", "03"):
+            return False
+        return _JSON_ERROR_PATTERN.search(response.content[:512]) is None
+
+    def set(self, method, url, params, response, exclude=()):
+        """
+        응답 저장
+        """
+        if not self.is_cacheable(response):
+            return
+        exclude = set(self.exclude_params) | set(exclude)
+        clean_url, secrets = self._strip_url(url, exclude)
+        secrets += [str(v) for k, v in (params or {}).items() if k in exclude and v]
+        ttl = self._get_ttl(url, params)
+        data = {
+            "expires": time.time() + ttl if ttl is not None else None,
+            "status_code": response.status_code,
+            "reason": response.reason,
+            "headers": dict(response.headers),
+            "encoding": response.encoding,
+            # 서비스키가 포함된 response.url 대신 서비스키를 제거한 요청 URL만 저장
+            "url": clean_url,
+            "content": response.content,
+        }
+        # 저장할 값에 서비스키가 남아 있으면 (응답 헤더, 본문에 포함된 경우 등) 저장하지 않음
+        if self._contains(data, secrets):
+            return
+        path = self._get_path(self.make_key(method, url, params, exclude))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # 임시 파일에 쓴 뒤 교체하여 동시에 읽는 경우에도 파일이 깨지지 않도록 함
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    @staticmethod
+    def _contains(data, secrets):
+        """
+        저장할 값에 서비스키(인코딩 전후 값 포함)가 들어 있는지 여부
+        """
+        if not secrets:
+            return False
+        text = repr((data["url"], data["headers"])).encode("utf-8") + (data["content"] or b"")
+        for secret in secrets:
+            for value in {secret, urllib.parse.quote(secret, safe=""), urllib.parse.unquote(secret)}:
+                if value and value.encode("utf-8") in text:
+                    return True
+        return False
+
+    def clear(self):
+        """
+        저장된 응답 전체 삭제
+        """
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                os.remove(os.path.join(root, name))
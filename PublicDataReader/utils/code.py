@@ -26,6 +26,32 @@ def code_bdong():
     return pd.DataFrame(read_json_file(_code_bdong_json_path))
 
 
+def get_bdong_codes(sigungu_code):
+    """
+    시군구의 최하위 법정동 코드(5자리) 목록 반환
+
+    말소되지 않은 법정동 중 시군구 자체와 하위 리가 있는 읍면을 제외한
+    법정동코드 뒤 5자리를 반환합니다. (건축물대장 bjdongCd 파라미터 형식)
+
+    Parameters
+    ----------
+    sigungu_code : str
+        시군구코드 (ex. 11110)
+
+    Returns
+    -------
+    list
+        법정동 코드 목록 (ex. ['10100', '10200', ...])
+    """
+    df = code_bdong()
+    codes = df.loc[(df["시군구코드"] == str(sigungu_code)) & df["말소일자"].isna(), "법정동코드"].astype(str)
+    codes = codes[codes.str[5:] != "00000"]
+    # 하위 리가 있는 읍면(뒤 2자리 00) 제외
+    parents = set(codes[codes.str[8:] != "00"].str[:8])
+    codes = codes[~((codes.str[8:] == "00") & codes.str[:8].isin(parents))]
+    return sorted(codes.str[5:].unique())
+
+
 def code_hdong():
     """
     행정기관코드(행정동) 데이터 반환
@@ -0,0 +1,145 @@
+"""
+컬럼 타입 변환 모듈
+
+컬럼별 타입 스키마에 따라 문자열 컬럼을 정수, 실수, 날짜 타입으로 변환합니다.
+공공데이터 응답은 같은 값이 반복되는 경우가 많으므로 고유값만 변환한 뒤
+전체 행에 다시 배치합니다.
+"""
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_numeric_dtype
+
+
+# 스키마 타입
+INTEGER = "integer"
+FLOAT = "float"
+DATE = "date"
+CATEGORY = "category"
+
+
+def _clean(values):
+    # 앞뒤 공백과 천 단위 구분 기호 제거
+    return values.str.strip().str.replace(",", "", regex=False)
+
+
+def _map_unique(series, func):
+    """
+    고유값에만 func를 적용한 뒤 원래 행 순서로 배치 (결측값은 결측값 유지)
+    """
+    codes, uniques = pd.factorize(series)
+    converted = func(pd.Series(uniques, dtype=object))
+    values = converted.array.take(codes, allow_fill=True)
+    return pd.Series(values, index=series.index, name=series.name)
+
+
+def coerce_series(series, dtype, date_format=None, errors="raise"):
+    """
+    문자열 시리즈 타입 변환
+
+    Parameters
+    ----------
+    series : Series
+        변환할 시리즈
+    dtype : str
+        변환할 타입 ("integer", "float", "date")
+    date_format : str, optional
+        날짜 형식 (ex. "%Y%m%d"), by default None (자동 인식)
+    errors : str, optional
+        변환할 수 없는 값 처리 방법, by default "raise"
+        "coerce"이면 결측값으로 변환합니다.
+
+    Returns
+    -------
+    Series
+        integer는 Int64, float는 float64, date는 datetime64 타입
+    """
+    if dtype == INTEGER:
+        return _map_unique(series, lambda u: pd.to_numeric(_clean(u), errors=errors).astype("Int64"))
+    if dtype == FLOAT:
+        return _map_unique(series, lambda u: pd.to_numeric(_clean(u), errors=errors))
+    if dtype == DATE:
+        return _map_unique(series, lambda u: pd.to_datetime(u.str.strip(), format=date_format, errors=errors))
+    raise ValueError(f"지원하지 않는 타입입니다: {dtype}")
+
+
+def coerce_frame(df, schema):
+    """
+    스키마에 따라 데이터프레임 컬럼 타입 변환
+
+    Parameters
+    ----------
+    df : DataFrame
+        변환할 데이터프레임 (변환 결과로 컬럼이 교체됨)
+    schema : dict
+        컬럼명을 키로, 타입("integer", "float", "date") 또는 (타입, 날짜 형식[, 오류 처리 방법]) 튜플을
+        값으로 하는 딕셔너리 (오류 처리 방법이 "coerce"이면 변환할 수 없는 값은 결측값으로 변환)
+        데이터프레임에 없는 컬럼은 무시합니다.
+
+    Examples
+    --------
+    >>> schema = {"거래금액": "integer", "전용면적": "float", "USE_DT": ("date", "%Y%m%d"),
+    ...           "해제사유발생일": ("date", "%y.%m.%d", "coerce")}
+    >>> df = coerce_frame(df, schema)
+    """
+    for col, dtype in schema.items():
+        if col not in df.columns:
+            continue
+        date_format, errors = None, "raise"
+        if isinstance(dtype, tuple):
+            dtype, date_format, *rest = dtype
+            errors = rest[0] if rest else errors
+        df[col] = coerce_series(df[col], dtype, date_format, errors=errors)
+    return df
+
+
+def _narrow_integer(series, dtype):
+    """
+    값 범위가 맞으면 더 작은 정수 타입으로 변환 (소수나 범위를 벗어난 값이 있으면 그대로 반환)
+    """
+    info = np.iinfo(dtype.lower())
+    if series.notna().any() and (series.min() < info.min or series.max() > info.max):
+        return series
+    try:
+        return series.astype(dtype)
+    except (TypeError, ValueError):
+        return series
+
+
+def compact_frame(df, schema):
+    """
+    메모리를 적게 사용하는 타입으로 데이터프레임 컬럼 변환
+
+    Parameters
+    ----------
+    df : DataFrame
+        변환할 데이터프레임 (변환 결과로 컬럼이 교체됨)
+    schema : dict
+        컬럼명을 키로, 타입을 값으로 하는 딕셔너리
+        - "category": 범주형 (반복되는 코드, 이름)
+        - "Int8", "Int16", "Int32", "Int64": 정수형 (값 범위를 벗어나면 변환하지 않음)
+        - "float32", "float64": 실수형
+        문자열 컬럼을 숫자형으로 변환할 때 숫자가 아닌 값은 결측값으로 변환합니다.
+        데이터프레임에 없는 컬럼은 무시합니다.
+
+    Examples
+    --------
+    >>> schema = {"법정동": "category", "층": "Int16", "전용면적": "float32"}
+    >>> df = compact_frame(df, schema)
+    """
+    for col, dtype in schema.items():
+        if col not in df.columns:
+            continue
+        series = df[col]
+        if dtype == CATEGORY:
+            df[col] = series.astype("category")
+        elif dtype.startswith("Int"):
+            if not is_numeric_dtype(series):
+                series = coerce_series(series, FLOAT, errors="coerce")
+            df[col] = _narrow_integer(series, dtype)
+        elif dtype.startswith("float"):
+            if not is_numeric_dtype(series):
+                series = coerce_series(series, FLOAT, errors="coerce")
+            df[col] = series.astype(dtype)
+        else:
+            raise ValueError(f"지원하지 않는 타입입니다: {dtype}")
+    return df
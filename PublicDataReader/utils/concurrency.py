@@ -0,0 +1,47 @@
+"""
+병렬 요청 모듈
+
+여러 요청을 스레드 풀에서 동시에 처리하면서 결과는 입력 순서대로 하나씩 반환합니다.
+"""
+import collections
+from concurrent.futures import ThreadPoolExecutor
+
+
+def imap_ordered(func, items, max_workers=1):
+    """
+    입력 순서대로 결과를 반환하는 병렬 map 제너레이터
+
+    동시에 처리 중인 작업을 max_workers개로 제한하므로, 결과를 모두 모으지 않고
+    하나씩 소비하면 메모리 사용량이 일정하게 유지됩니다.
+
+    Parameters
+    ----------
+    func : callable
+        각 항목에 적용할 함수
+    items : iterable
+        입력 항목
+    max_workers : int, optional
+        동시에 처리할 최대 작업 수, by default 1 (순차 처리)
+    """
+    if not max_workers or max_workers <= 1:
+        for item in items:
+            yield func(item)
+        return
+    items = iter(items)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = collections.deque()
+        try:
+            for item in items:
+                futures.append(executor.submit(func, item))
+                if len(futures) >= max_workers:
+                    break
+            while futures:
+                result = futures.popleft().result()
+                # 하나를 반환할 때마다 다음 작업을 하나 추가
+                for item in items:
+                    futures.append(executor.submit(func, item))
+                    break
+                yield result
+        finally:
+            for future in futures:
+                future.cancel()
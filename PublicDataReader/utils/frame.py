@@ -0,0 +1,98 @@
+"""
+데이터프레임 생성 모듈
+
+페이지, 행 단위로 받은 결과를 컬럼별 리스트에 모아 두었다가
+마지막에 한 번만 데이터프레임으로 만듭니다.
+"""
+import numpy as np
+import pandas as pd
+
+
+class FrameBuilder:
+    """
+    컬럼 단위 데이터프레임 생성기
+
+    행(dict) 또는 컬럼(dict of list)을 추가하면 컬럼별 리스트에 이어 붙이고,
+    build 호출 시 데이터프레임을 한 번만 생성합니다.
+    페이지마다 pd.concat으로 이어 붙이는 방식과 달리 전체 행 수에 비례하는 시간이 걸립니다.
+
+    Parameters
+    ----------
+    columns : list, optional
+        기본 컬럼 목록, by default None
+        지정한 컬럼은 값이 없어도 결과에 포함되며, 추가된 행에만 있는 컬럼은 뒤에 붙습니다.
+    dtype : optional
+        생성할 데이터프레임의 데이터 타입, by default object
+        None이면 pandas가 컬럼별로 추론합니다.
+
+    Examples
+    --------
+    >>> builder = FrameBuilder(columns=["a", "b"])
+    >>> builder.append({"a": "1", "b": "2"})
+    >>> builder.extend([{"a": "3"}, {"a": "5", "c": "6"}])
+    >>> df = builder.build()
+    """
+
+    def __init__(self, columns=None, dtype=object):
+        self.dtype = dtype
+        self.data = {col: [] for col in (columns or [])}
+        self.length = 0
+
+    def _add_column(self, col):
+        # 새 컬럼은 이전 행을 결측값으로 채움
+        self.data[col] = [np.nan] * self.length
+
+    def append(self, record):
+        """
+        행 1개 추가
+        """
+        for col in record:
+            if col not in self.data:
+                self._add_column(col)
+        for col, values in self.data.items():
+            values.append(record.get(col, np.nan))
+        self.length += 1
+
+    def extend(self, records):
+        """
+        행 여러 개 추가
+        """
+        for record in records:
+            self.append(record)
+
+    def add_columns(self, columns):
+        """
+        컬럼별 값 리스트 추가
+
+        Parameters
+        ----------
+        columns : dict
+            컬럼명을 키로, 같은 길이의 값 리스트를 값으로 하는 딕셔너리
+        """
+        if not columns:
+            return
+        size = len(next(iter(columns.values())))
+        for col in columns:
+            if col not in self.data:
+                self._add_column(col)
+        for col, values in self.data.items():
+            if col in columns:
+                values.extend(columns[col])
+            else:
+                values.extend([np.nan] * size)
+        self.length += size
+
+    def add_frame(self, df):
+        """
+        데이터프레임 추가
+        """
+        self.add_columns({col: df[col].tolist() for col in df.columns})
+
+    def __len__(self):
+        return self.length
+
+    def build(self):
+        """
+        데이터프레임 생성
+        """
+        return pd.DataFrame(self.data, columns=list(self.data), dtype=self.dtype)
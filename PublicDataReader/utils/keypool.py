@@ -0,0 +1,145 @@
+"""
+서비스키 풀 모듈
+
+여러 개의 서비스키를 번갈아 사용하고, 일일 요청 한도를 초과한 서비스키는
+한도가 초기화될 때까지 사용 목록에서 제외합니다.
+"""
+import time
+import datetime
+import threading
+import urllib.parse
+
+
+# 공공데이터포털 요청 한도 초과 결과코드
+#   22: LIMITED_NUMBER_OF_SERVICE_REQUESTS_EXCEEDS_ERROR
+QUOTA_EXCEEDED_CODES = ("22",)
+# 공공데이터포털 일일 트래픽 초기화 기준 시간대 (한국 표준시)
+KST = datetime.timezone(datetime.timedelta(hours=9))
+
+
+def get_next_reset_time(reset_hour=0, tz=KST):
+    """
+    다음 요청 한도 초기화 시각(epoch 초) 반환
+
+    Parameters
+    ----------
+    reset_hour : int
+        요청 한도가 초기화되는 시각 (기본값: 0시)
+    tz : datetime.timezone
+        기준 시간대 (기본값: 한국 표준시)
+    """
+    now = datetime.datetime.now(tz)
+    reset = now.replace(hour=reset_hour, minute=0, second=0, microsecond=0)
+    if reset <= now:
+        reset += datetime.timedelta(days=1)
+    return reset.timestamp()
+
+
+class ServiceKeyPool:
+    """
+    서비스키 풀
+
+    요청마다 사용 가능한 서비스키를 순서대로 돌아가며 반환합니다.
+    요청 한도 초과 결과코드를 받은 서비스키는 다음 초기화 시각까지 제외됩니다.
+
+    Parameters
+    ----------
+    keys : list
+        서비스키 목록 (인코딩, 디코딩 키 모두 가능)
+    quota_codes : tuple
+        요청 한도 초과로 판단할 결과코드 (기본값: ("22",))
+    reset_hour : int
+        요청 한도가 초기화되는 시각, 한국 표준시 기준 (기본값: 0시)
+
+    Examples
+    --------
+    >>> import PublicDataReader as pdr
+    >>> api = pdr.TransactionPrice(["서비스키1", "서비스키2", "서비스키3"])
+    >>> api.key_pool.status()
+    """
+
+    def __init__(self, keys, quota_codes=QUOTA_EXCEEDED_CODES, reset_hour=0):
+        if isinstance(keys, str):
+            keys = [keys]
+        self.keys = [urllib.parse.unquote(key) for key in keys if key]
+        if not self.keys:
+            raise ValueError("서비스키를 입력해주세요.")
+        self.quota_codes = tuple(quota_codes)
+        self.reset_hour = reset_hour
+        self.suspended = {}
+        self.counts = {key: 0 for key in self.keys}
+        self._index = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_value(cls, service_key):
+        """
+        서비스키 문자열, 목록 또는 ServiceKeyPool로부터 서비스키 풀 생성
+
+        service_key가 None이면 None을 반환합니다.
+        """
+        if service_key is None or isinstance(service_key, cls):
+            return service_key
+        return cls(service_key)
+
+    def _release_expired(self, now):
+        for key, until in list(self.suspended.items()):
+            if until <= now:
+                del self.suspended[key]
+
+    def get(self):
+        """
+        다음 사용 가능한 서비스키 반환
+
+        모든 서비스키가 제외된 경우 가장 먼저 초기화되는 서비스키를 반환합니다.
+        """
+        with self._lock:
+            self._release_expired(time.time())
+            for _ in range(len(self.keys)):
+                key = self.keys[self._index % len(self.keys)]
+                self._index += 1
+                if key not in self.suspended:
+                    self.counts[key] += 1
+                    return key
+            key = min(self.suspended, key=self.suspended.get)
+            self.counts[key] += 1
+            return key
+
+    def suspend(self, key, until=None):
+        """
+        서비스키를 사용 목록에서 제외
+
+        Parameters
+        ----------
+        key : str
+            제외할 서비스키
+        until : float, optional
+            제외 종료 시각(epoch 초), by default None (다음 초기화 시각)
+        """
+        if until is None:
+            until = get_next_reset_time(self.reset_hour)
+        with self._lock:
+            self.suspended[key] = until
+
+    def available(self):
+        """
+        사용 가능한 서비스키 수 반환
+        """
+        with self._lock:
+            self._release_expired(time.time())
+            return len(self.keys) - len(self.suspended)
+
+    def status(self):
+        """
+        서비스키별 요청 수와 제외 여부 반환
+        """
+        with self._lock:
+            self._release_expired(time.time())
+            return [{
+                "serviceKey": key[:6] + "..." if len(key) > 6 else key,
+                "requests": self.counts[key],
+                "suspended_until": datetime.datetime.fromtimestamp(self.suspended[key], KST) if key in self.suspended else None,
+            } for key in self.keys]
+
+    def __len__(self):
+        return len(self.keys)
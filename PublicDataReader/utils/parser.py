@@ -0,0 +1,180 @@
+"""
+XML 응답 파서 모듈
+
+lxml iterparse로 XML 응답을 순차적으로 읽으면서 item 요소를 바로
+컬럼별 리스트로 변환합니다. 전체 문서를 중첩 딕셔너리로 만들지 않으므로
+xmltodict보다 빠르고 메모리를 적게 사용합니다.
+"""
+import io
+import numpy as np
+from lxml import etree
+
+
+# 헤더로 인식할 요소 이름 (공공데이터포털 오류 응답은 cmmMsgHeader 사용)
+HEADER_TAGS = ("header", "cmmMsgHeader")
+# 행 요소를 담는 부모 요소 이름
+CONTAINER_TAGS = ("items", "body")
+
+
+class XmlResponse:
+    """
+    XML 응답 파싱 결과
+
+    Attributes
+    ----------
+    root : str
+        최상위 요소 이름 (ex. response)
+    header : dict
+        헤더 요소 값 (ex. {"resultCode": "00", "resultMsg": "NORMAL SERVICE."})
+    body : dict
+        body 바로 아래 값 요소 (ex. {"numOfRows": "10", "pageNo": "1", "totalCount": "3"})
+        body 요소가 없으면 None
+    columns : dict
+        컬럼명을 키로, 행 순서대로 값을 담은 리스트를 값으로 하는 딕셔너리
+    count : int
+        행 수
+    """
+
+    def __init__(self):
+        self.root = None
+        self.header = {}
+        self.body = None
+        self.columns = {}
+        self.count = 0
+
+    @property
+    def result_code(self):
+        return self.header.get("resultCode") or self.header.get("returnReasonCode")
+
+    @property
+    def result_msg(self):
+        return self.header.get("resultMsg") or self.header.get("returnAuthMsg")
+
+    def to_records(self):
+        """
+        행 딕셔너리 목록 반환 (값이 없는 컬럼은 제외)
+        """
+        names = list(self.columns)
+        records = []
+        for values in zip(*self.columns.values()):
+            records.append({name: value for name, value in zip(names, values)
+                            if value is not np.nan})
+        return records
+
+    def select(self, names, fill=""):
+        """
+        지정한 컬럼만 순서대로 반환
+
+        행에 없는 컬럼과 빈 값은 fill로 채웁니다.
+
+        Parameters
+        ----------
+        names : list
+            반환할 컬럼명 목록
+        fill : optional
+            빈 값을 채울 값, by default ""
+
+        Returns
+        -------
+        dict
+            컬럼명을 키로, 값 리스트를 값으로 하는 딕셔너리
+        """
+        result = {}
+        for name in names:
+            values = self.columns.get(name)
+            if values is None:
+                result[name] = [fill] * self.count
+            else:
+                result[name] = [value if isinstance(value, str) else fill for value in values]
+        return result
+
+
+def _get_text(elem):
+    text = elem.text
+    if text is None:
+        return None
+    return text.strip() or None
+
+
+def parse_xml(content, item_tags=("item",)):
+    """
+    XML 응답을 헤더, body 값, 컬럼별 리스트로 변환
+
+    item_tags에 해당하는 요소(items 또는 body의 자식)를 행으로 보고,
+    행의 자식 요소 이름을 컬럼명, 텍스트를 값으로 사용합니다.
+    값의 앞뒤 공백은 제거하고 빈 값은 None, 행에 없는 컬럼은 NaN으로 채웁니다.
+
+    Parameters
+    ----------
+    content : bytes or str
+        XML 응답 본문 (requests.Response.content)
+    item_tags : tuple, optional
+        행으로 볼 요소 이름, by default ("item",)
+
+    Returns
+    -------
+    XmlResponse
+        파싱 결과
+
+    Raises
+    ------
+    lxml.etree.XMLSyntaxError
+        XML 형식이 아닌 경우
+    """
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    item_tags = frozenset(item_tags)
+    result = XmlResponse()
+    columns = result.columns
+    count = 0
+    last_tags, last_values, last_index = None, [], None
+    # 행, 헤더, body 요소의 종료 이벤트만 받아 처리
+    tags = list(item_tags) + list(HEADER_TAGS) + ["body"]
+    context = etree.iterparse(io.BytesIO(content), events=("end",), tag=tags,
+                              huge_tree=True, remove_comments=True)
+    for _, elem in context:
+        parent = elem.getparent()
+        tag = elem.tag
+        if tag in item_tags:
+            if parent is None or parent.tag not in CONTAINER_TAGS:
+                continue
+            children = list(elem)
+            row_tags = [child.tag for child in children]
+            if row_tags != last_tags:
+                # 컬럼 구성이 이전 행과 다를 때만 컬럼 리스트를 다시 찾음
+                last_tags = row_tags
+                for child_tag in row_tags:
+                    if child_tag not in columns:
+                        columns[child_tag] = [np.nan] * count
+                # 같은 행에 같은 이름의 요소가 반복되면 첫 번째 값만 사용
+                unique_tags = list(dict.fromkeys(row_tags))
+                last_values = [columns[child_tag] for child_tag in unique_tags]
+                if len(unique_tags) != len(row_tags):
+                    first = {child_tag: row_tags.index(child_tag) for child_tag in unique_tags}
+                    last_index = [first[child_tag] for child_tag in unique_tags]
+                else:
+                    last_index = None
+            if last_index is not None:
+                children = [children[i] for i in last_index]
+            for values, child in zip(last_values, children):
+                text = child.text
+                # xmltodict와 같이 앞뒤 공백을 제거하고 빈 문자열은 None으로 변환
+                values.append(text.strip() or None if text is not None else None)
+            count += 1
+            # 행에 없는 컬럼은 NaN으로 채움
+            if len(last_values) != len(columns):
+                for values in columns.values():
+                    if len(values) < count:
+                        values.append(np.nan)
+            # 처리한 행 요소를 메모리에서 해제
+            elem.clear()
+            while elem.getprevious() is not None:
+                del parent[0]
+        elif tag == "body":
+            result.body = {child.tag: _get_text(child) for child in elem
+                           if len(child) == 0 and child.tag not in item_tags}
+        else:
+            result.header.update((child.tag, _get_text(child)) for child in elem if len(child) == 0)
+    result.root = context.root.tag
+    result.count = count
+    return result
@@ -0,0 +1,128 @@
+"""
+요청 속도 제한 모듈
+
+토큰 버킷(Token Bucket) 방식으로 호스트별, 서비스키별 초당 요청 수를 제한합니다.
+"""
+import time
+import threading
+import urllib.parse
+
+
+# 기본 공용 Transport에 적용하는 호스트별 초당 요청 수
+# 공공데이터포털 Open API 명세의 최대 초당 트랜잭션(30 tps)을 호스트 전체 요청에 적용
+DEFAULT_HOST_LIMITS = {"apis.data.go.kr": 30}
+
+
+class TokenBucket:
+    """
+    토큰 버킷
+
+    초당 rate개의 토큰이 채워지고 최대 capacity개까지 쌓입니다.
+    요청 1건마다 토큰 1개를 사용하며, 토큰이 부족하면 채워질 때까지 대기합니다.
+
+    Parameters
+    ----------
+    rate : float
+        초당 허용 요청 수
+    capacity : float, optional
+        순간적으로 허용할 최대 요청 수, by default None (rate와 동일)
+    """
+
+    def __init__(self, rate, capacity=None):
+        if rate <= 0:
+            raise ValueError("rate는 0보다 커야 합니다.")
+        self.rate = float(rate)
+        self.capacity = float(capacity) if capacity else max(self.rate, 1.0)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self, tokens=1):
+        """
+        토큰 사용 (부족하면 대기)
+
+        Returns
+        -------
+        float
+            대기한 시간(초)
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity,
+                              self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            # 토큰을 미리 차감(예약)하고 부족한 만큼만 잠금 밖에서 대기
+            self.tokens -= tokens
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class RateLimiter:
+    """
+    호스트별, 서비스키별 요청 속도 제한
+
+    Transport의 모든 요청 전에 호출되어 해당 호스트와 서비스키의 토큰 버킷에서
+    토큰을 하나씩 사용합니다. 설정하지 않은 항목은 제한하지 않습니다.
+
+    Parameters
+    ----------
+    per_host : float, optional
+        호스트별 기본 초당 요청 수, by default None (제한 없음)
+    per_key : float, optional
+        서비스키별 초당 요청 수, by default None (제한 없음)
+    host_limits : dict, optional
+        호스트별 초당 요청 수 (ex. {"apis.data.go.kr": 20}), by default None
+        per_host보다 우선 적용됩니다.
+    burst : float, optional
+        순간적으로 허용할 최대 요청 수, by default None (초당 요청 수와 동일)
+    key_params : tuple, optional
+        서비스키로 인식할 요청 파라미터 이름, by default ("serviceKey",)
+
+    Examples
+    --------
+    >>> import PublicDataReader as pdr
+    >>> limiter = pdr.RateLimiter(per_host=30, per_key=10)
+    >>> transport = pdr.Transport(rate_limiter=limiter)
+    >>> api = pdr.BuildingLedger(service_key, transport=transport)
+    """
+
+    def __init__(self, per_host=None, per_key=None, host_limits=None, burst=None, key_params=("serviceKey",)):
+        self.per_host = per_host
+        self.per_key = per_key
+        self.host_limits = dict(host_limits or {})
+        self.burst = burst
+        self.key_params = tuple(key_params)
+        self.buckets = {}
+        self.lock = threading.Lock()
+
+    def _get_bucket(self, name, rate):
+        with self.lock:
+            bucket = self.buckets.get(name)
+            if bucket is None:
+                bucket = TokenBucket(rate, self.burst)
+                self.buckets[name] = bucket
+            return bucket
+
+    def acquire(self, url, params=None):
+        """
+        요청 전 호스트, 서비스키 토큰 사용 (부족하면 대기)
+
+        Parameters
+        ----------
+        url : str
+            요청 URL
+        params : dict, optional
+            요청 파라미터
+        """
+        host = urllib.parse.urlparse(url).hostname
+        rate = self.host_limits.get(host, self.per_host)
+        if rate:
+            self._get_bucket(("host", host), rate).acquire()
+        if self.per_key and isinstance(params, dict):
+            for key_param in self.key_params:
+                key = params.get(key_param)
+                if key:
+                    self._get_bucket(("key", key), self.per_key).acquire()
+                    break
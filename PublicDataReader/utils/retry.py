@@ -0,0 +1,149 @@
+"""
+요청 재시도 모듈
+
+연결 오류, 5xx 응답, 일시적인 공공데이터포털 결과코드를 재시도 대상으로 분류하고
+지수 백오프(Exponential Backoff)와 지터(Jitter)를 적용하여 재시도합니다.
+"""
+import re
+import random
+import threading
+import requests
+
+
+# 공공데이터포털 결과코드 (resultCode, returnReasonCode)
+#   01: APPLICATION_ERROR
+#   02: DB_ERROR
+#   04: HTTP_ERROR
+#   05: SERVICETIMEOUT_ERROR
+#   99: UNKNOWN_ERROR
+# 22(LIMITED_NUMBER_OF_SERVICE_REQUESTS_EXCEEDS_ERROR)는 일일 요청 한도 초과로
+# 다음 날 0시(한국 표준시)까지 재시도해도 성공하지 않으므로 제외 (ServiceKeyPool에서 다른 서비스키로 교체)
+RETRYABLE_RESULT_CODES = ("01", "02", "04", "05", "99")
+RETRYABLE_STATUS_CODES = (429, 500, 502, 503, 504)
+RETRYABLE_EXCEPTIONS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+)
+
+_RESULT_CODE_PATTERN = re.compile(
+    rb"<(?:resultCode|returnReasonCode)>\s*([0-9A-Za-z_-]+)\s*</")
+
+
+def get_result_code(response, size=4096):
+    """
+    XML 응답 본문 앞부분에서 결과코드 추출
+
+    Parameters
+    ----------
+    response : requests.Response
+        HTTP 응답
+    size : int
+        결과코드를 찾을 본문 앞부분 크기(byte), by default 4096
+
+    Returns
+    -------
+    str or None
+        결과코드 (ex. '00', '22'), 찾지 못하면 None
+    """
+    try:
+        match = _RESULT_CODE_PATTERN.search(response.content[:size])
+    except Exception:
+        return None
+    if match:
+        return match.group(1).decode("ascii")
+    return None
+
+
+class RetryPolicy:
+    """
+    요청 재시도 정책
+
+    Parameters
+    ----------
+    max_retries : int
+        최대 재시도 횟수 (기본값: 3)
+    backoff_factor : float
+        백오프 기본 대기 시간(초), n번째 재시도 전 최대 backoff_factor * 2^n초 대기 (기본값: 1.0)
+    max_backoff : float
+        최대 대기 시간(초) (기본값: 60)
+    jitter : bool
+        True이면 0 ~ 백오프 시간 사이에서 무작위로 대기 (기본값: True)
+    retry_status_codes : tuple
+        재시도할 HTTP 상태 코드 (기본값: 429, 500, 502, 503, 504)
+    retry_result_codes : tuple
+        재시도할 공공데이터포털 결과코드 (기본값: 01, 02, 04, 05, 99)
+
+    Attributes
+    ----------
+    stats : dict
+        요청 수(requests), 백오프 재시도 수(retries), 서비스키 교체 수(rotations),
+        최종 실패 수(failures) 누적 기록
+    """
+
+    def __init__(self,
+                 max_retries=3,
+                 backoff_factor=1.0,
+                 max_backoff=60,
+                 jitter=True,
+                 retry_status_codes=RETRYABLE_STATUS_CODES,
+                 retry_result_codes=RETRYABLE_RESULT_CODES):
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_status_codes = tuple(retry_status_codes)
+        self.retry_result_codes = tuple(retry_result_codes)
+        self.stats = {"requests": 0, "retries": 0, "rotations": 0, "failures": 0}
+        self._lock = threading.Lock()
+
+    def is_retryable(self, response=None, error=None):
+        """
+        응답 또는 예외의 재시도 대상 여부
+
+        Parameters
+        ----------
+        response : requests.Response, optional
+            HTTP 응답
+        error : Exception, optional
+            요청 중 발생한 예외
+        """
+        if error is not None:
+            return isinstance(error, RETRYABLE_EXCEPTIONS)
+        if response.status_code in self.retry_status_codes:
+            return True
+        return get_result_code(response) in self.retry_result_codes
+
+    def get_backoff(self, attempt):
+        """
+        재시도 전 대기 시간(초)
+
+        Parameters
+        ----------
+        attempt : int
+            지금까지의 재시도 횟수 (0부터 시작)
+        """
+        backoff = min(self.max_backoff, self.backoff_factor * (2 ** attempt))
+        if self.jitter:
+            return random.uniform(0, backoff)
+        return backoff
+
+    def record(self, attempts, failed=False, rotations=0):
+        """
+        요청 1건의 시도 횟수 기록
+
+        Parameters
+        ----------
+        attempts : int
+            전체 시도 횟수
+        failed : bool
+            최종 실패 여부
+        rotations : int
+            시도 횟수 중 요청 한도 초과로 서비스키를 바꿔 다시 요청한 횟수 (재시도 수에서 제외)
+        """
+        with self._lock:
+            self.stats["requests"] += 1
+            self.stats["retries"] += attempts - 1 - rotations
+            self.stats["rotations"] += rotations
+            if failed:
+                self.stats["failures"] += 1
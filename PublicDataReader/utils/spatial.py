@@ -0,0 +1,226 @@
+"""
+로컬 공간 인덱스 모듈
+
+조회한 상가업소의 경도, 위도를 격자(grid) 셀 단위로 정렬해 두고
+반경, 사각형, 다각형 조회를 API 요청 없이 메모리에서 처리합니다.
+"""
+import re
+import numpy as np
+import pandas as pd
+
+
+# 지구 평균 반지름(m)
+EARTH_RADIUS = 6371008.8
+
+
+def haversine(lon1, lat1, lon2, lat2):
+    """
+    두 지점 사이의 대원 거리(m) 계산 (numpy 배열 가능)
+    """
+    lon1, lat1, lon2, lat2 = map(np.radians, (lon1, lat1, lon2, lat2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+def _parse_polygon(polygon):
+    """
+    WKT POLYGON 문자열 또는 (경도, 위도) 목록을 (n, 2) 배열로 변환 (외곽선만 사용)
+    """
+    if isinstance(polygon, str):
+        match = re.search(r"\(\(([^()]*)\)", polygon)
+        if match is None:
+            raise ValueError("다각형 형식을 확인해주세요. (ex. POLYGON((x1 y1, x2 y2, x3 y3)))")
+        polygon = [point.split() for point in match.group(1).split(",")]
+    vertices = np.asarray(polygon, dtype=float)
+    if vertices.ndim != 2 or vertices.shape[1] != 2 or len(vertices) < 3:
+        raise ValueError("다각형은 3개 이상의 (경도, 위도) 좌표가 필요합니다.")
+    return vertices
+
+
+def points_in_polygon(x, y, polygon):
+    """
+    점들이 다각형 안에 있는지 여부 (ray casting, 점 배열에 대해 벡터 연산)
+
+    Parameters
+    ----------
+    x, y : array-like
+        점의 경도, 위도 배열
+    polygon : str, list
+        WKT POLYGON 문자열 또는 (경도, 위도) 좌표 목록
+
+    Returns
+    -------
+    numpy.ndarray
+        다각형 안에 있으면 True인 bool 배열
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    vertices = _parse_polygon(polygon)
+    inside = np.zeros(x.shape, dtype=bool)
+    x1, y1 = vertices[-1]
+    # 변마다 점에서 오른쪽으로 그은 반직선과 교차하면 내부 여부를 뒤집음
+    for x2, y2 in vertices:
+        crosses = (y1 > y) != (y2 > y)
+        if crosses.any():
+            with np.errstate(divide="ignore", invalid="ignore"):
+                x_cross = x1 + (y - y1) * (x2 - x1) / (y2 - y1)
+            inside ^= crosses & (x < x_cross)
+        x1, y1 = x2, y2
+    return inside
+
+
+class SpatialIndex:
+    """
+    경도, 위도 격자 공간 인덱스
+
+    점을 cell_size(도) 크기의 격자 셀 번호 순서로 정렬해 두고, 조회 영역과 겹치는 셀의
+    점만 골라 정확한 조건으로 다시 거릅니다. 조회 결과는 인덱스를 만들 때 전달한
+    점(데이터프레임 행)의 위치 배열이며, 좌표가 없는 점은 조회되지 않습니다.
+
+    Parameters
+    ----------
+    lon, lat : array-like
+        점의 경도, 위도 (숫자로 변환할 수 없는 값은 좌표가 없는 점으로 처리)
+    cell_size : float
+        격자 셀 크기(도), by default 0.005 (약 500m)
+
+    Examples
+    --------
+    >>> import PublicDataReader as pdr
+    >>> df = api.get_tiled_data("사각형상가", 126.76, 37.41, 127.19, 37.71)
+    >>> index = pdr.SpatialIndex.from_frame(df)
+    >>> stores = df.iloc[index.radius(127.0276, 37.4979, 500)]
+    """
+
+    def __init__(self, lon, lat, cell_size=0.005):
+        lon = pd.to_numeric(pd.Series(np.asarray(lon, dtype=object)), errors="coerce").to_numpy(dtype=float)
+        lat = pd.to_numeric(pd.Series(np.asarray(lat, dtype=object)), errors="coerce").to_numpy(dtype=float)
+        if lon.shape != lat.shape:
+            raise ValueError("경도와 위도의 길이가 다릅니다.")
+        self.cell_size = float(cell_size)
+        self.size = len(lon)
+        positions = np.flatnonzero(np.isfinite(lon) & np.isfinite(lat))
+        lon, lat = lon[positions], lat[positions]
+        if len(positions):
+            self.origin = (lon.min(), lat.min())
+            self.shape = (int((lon.max() - self.origin[0]) // self.cell_size) + 1,
+                          int((lat.max() - self.origin[1]) // self.cell_size) + 1)
+        else:
+            self.origin, self.shape = (0.0, 0.0), (1, 1)
+        # 셀 번호(행 우선) 순서로 점 정렬
+        cells = self._cell(lon, 0) + self._cell(lat, 1) * self.shape[0]
+        order = np.argsort(cells, kind="stable")
+        self.cells = cells[order]
+        self.positions = positions[order]
+        self.lon = lon[order]
+        self.lat = lat[order]
+
+    @classmethod
+    def from_frame(cls, df, lon=None, lat=None, cell_size=0.005):
+        """
+        데이터프레임으로 공간 인덱스 생성
+
+        Parameters
+        ----------
+        df : DataFrame
+            상가업소 데이터프레임
+        lon, lat : str, optional
+            경도, 위도 컬럼명, by default None (경도/lon, 위도/lat 컬럼 자동 선택)
+        cell_size : float
+            격자 셀 크기(도), by default 0.005
+        """
+        lon = lon or next((col for col in ("경도", "lon") if col in df.columns), None)
+        lat = lat or next((col for col in ("위도", "lat") if col in df.columns), None)
+        if lon is None or lat is None:
+            raise KeyError("경도, 위도 컬럼을 지정해주세요.")
+        return cls(df[lon].to_numpy(), df[lat].to_numpy(), cell_size=cell_size)
+
+    def __len__(self):
+        return self.size
+
+    def _cell(self, values, axis):
+        cell = np.floor((np.asarray(values, dtype=float) - self.origin[axis]) / self.cell_size)
+        return np.clip(cell, 0, self.shape[axis] - 1).astype(np.int64)
+
+    def _candidates(self, minx, miny, maxx, maxy):
+        """
+        사각형과 겹치는 셀에 속한 점의 정렬 위치 배열
+        """
+        if maxx < minx or maxy < miny or not len(self.cells):
+            return np.empty(0, dtype=np.int64)
+        x0, x1 = self._cell(minx, 0), self._cell(maxx, 0)
+        rows = np.arange(self._cell(miny, 1), self._cell(maxy, 1) + 1)
+        # 같은 행의 연속된 셀은 정렬된 배열에서도 연속된 구간
+        starts = np.searchsorted(self.cells, rows * self.shape[0] + x0, side="left")
+        ends = np.searchsorted(self.cells, rows * self.shape[0] + x1, side="right")
+        if not len(starts):
+            return np.empty(0, dtype=np.int64)
+        return np.concatenate([np.arange(start, end) for start, end in zip(starts, ends)])
+
+    def rectangle(self, minx, miny, maxx, maxy):
+        """
+        사각형 안(경계 포함)의 점 조회
+
+        Parameters
+        ----------
+        minx, miny, maxx, maxy : float
+            최소 경도, 최소 위도, 최대 경도, 최대 위도
+
+        Returns
+        -------
+        numpy.ndarray
+            점 위치 배열 (오름차순)
+        """
+        idx = self._candidates(minx, miny, maxx, maxy)
+        lon, lat = self.lon[idx], self.lat[idx]
+        mask = (lon >= minx) & (lon <= maxx) & (lat >= miny) & (lat <= maxy)
+        return np.sort(self.positions[idx[mask]])
+
+    def radius(self, cx, cy, radius, return_distance=False):
+        """
+        중심점에서 반경(m) 안의 점 조회
+
+        Parameters
+        ----------
+        cx, cy : float
+            중심점 경도, 위도
+        radius : float
+            반경(m)
+        return_distance : bool
+            거리 배열도 반환할지 여부, by default False
+
+        Returns
+        -------
+        numpy.ndarray or tuple
+            거리 순으로 정렬한 점 위치 배열 (return_distance=True이면 (위치 배열, 거리 배열))
+        """
+        dlat = np.degrees(radius / EARTH_RADIUS)
+        dlon = dlat / max(np.cos(np.radians(min(abs(cy) + dlat, 89.9))), 1e-12)
+        idx = self._candidates(cx - dlon, cy - dlat, cx + dlon, cy + dlat)
+        distance = haversine(cx, cy, self.lon[idx], self.lat[idx])
+        mask = distance <= radius
+        idx, distance = idx[mask], distance[mask]
+        order = np.argsort(distance, kind="stable")
+        if return_distance:
+            return self.positions[idx[order]], distance[order]
+        return self.positions[idx[order]]
+
+    def polygon(self, polygon):
+        """
+        다각형 안의 점 조회
+
+        Parameters
+        ----------
+        polygon : str, list
+            WKT POLYGON 문자열 (다각형상가 key와 같은 형식) 또는 (경도, 위도) 좌표 목록
+
+        Returns
+        -------
+        numpy.ndarray
+            점 위치 배열 (오름차순)
+        """
+        vertices = _parse_polygon(polygon)
+        (minx, miny), (maxx, maxy) = vertices.min(axis=0), vertices.max(axis=0)
+        idx = self._candidates(minx, miny, maxx, maxy)
+        mask = points_in_polygon(self.lon[idx], self.lat[idx], vertices)
+        return np.sort(self.positions[idx[mask]])
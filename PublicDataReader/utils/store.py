@@ -0,0 +1,247 @@
+"""
+로컬 저장소 모듈
+
+부동산 실거래가 데이터를 부동산 유형, 거래 유형, 시군구, 연월 단위 파티션으로
+디스크에 저장하고, 이미 저장된 파티션을 다시 요청하지 않도록 합니다.
+상가업소처럼 키가 있는 데이터는 하나의 테이블로 저장하고 변경분만 반영합니다.
+"""
+import os
+import json
+import tempfile
+import pandas as pd
+
+
+def _atomic_write(path, write):
+    """
+    임시 파일에 쓴 뒤 교체하여 중단되어도 파일이 깨지지 않도록 저장
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    os.close(fd)
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class PartitionStore:
+    """
+    부동산 실거래가 파티션 저장소
+
+    파티션 하나는 (부동산 유형, 거래 유형, 시군구코드, 연월) 조합 하나의
+    데이터프레임이며 directory/부동산유형/거래유형/시군구코드/연월.pkl 파일로 저장됩니다.
+    조회 결과가 없는 연월도 빈 파티션으로 저장하여 조회한 연월임을 기록합니다.
+
+    Parameters
+    ----------
+    directory : str
+        파티션 파일 저장 경로
+
+    Examples
+    --------
+    >>> import PublicDataReader as pdr
+    >>> store = pdr.PartitionStore("./molit")
+    >>> api = pdr.TransactionPrice(service_key)
+    >>> api.sync(store, ["11650"], "200601", property_types=["아파트"], trade_types=["매매"])
+    >>> df = store.load("아파트", "매매")
+    """
+
+    extension = ".pkl"
+
+    def __init__(self, directory):
+        self.directory = os.path.expanduser(directory)
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _get_path(self, property_type, trade_type, sigungu_code, year_month):
+        return os.path.join(self.directory, property_type, trade_type,
+                            str(sigungu_code), str(year_month) + self.extension)
+
+    def exists(self, property_type, trade_type, sigungu_code, year_month):
+        """
+        파티션 저장 여부
+        """
+        return os.path.exists(self._get_path(property_type, trade_type, sigungu_code, year_month))
+
+    def read(self, property_type, trade_type, sigungu_code, year_month):
+        """
+        파티션 읽기 (없으면 None)
+        """
+        path = self._get_path(property_type, trade_type, sigungu_code, year_month)
+        if not os.path.exists(path):
+            return None
+        return pd.read_pickle(path)
+
+    def write(self, property_type, trade_type, sigungu_code, year_month, df):
+        """
+        파티션 저장 (기존 파티션은 교체)
+        """
+        path = self._get_path(property_type, trade_type, sigungu_code, year_month)
+        _atomic_write(path, df.to_pickle)
+
+    def partitions(self, property_type=None, trade_type=None, sigungu_code=None):
+        """
+        저장된 파티션 목록 반환
+
+        Returns
+        -------
+        list
+            (부동산 유형, 거래 유형, 시군구코드, 연월) 튜플 목록
+        """
+        result = []
+        for p_type in self._list_dir(self.directory, property_type):
+            p_dir = os.path.join(self.directory, p_type)
+            for t_type in self._list_dir(p_dir, trade_type):
+                t_dir = os.path.join(p_dir, t_type)
+                for code in self._list_dir(t_dir, sigungu_code):
+                    for name in sorted(os.listdir(os.path.join(t_dir, code))):
+                        if name.endswith(self.extension):
+                            result.append((p_type, t_type, code, name[:-len(self.extension)]))
+        return result
+
+    @staticmethod
+    def _list_dir(path, name=None):
+        if name is not None:
+            return [str(name)] if os.path.isdir(os.path.join(path, str(name))) else []
+        if not os.path.isdir(path):
+            return []
+        return sorted(n for n in os.listdir(path) if os.path.isdir(os.path.join(path, n)))
+
+    def load(self,
+             property_type,
+             trade_type,
+             sigungu_codes=None,
+             start_year_month=None,
+             end_year_month=None):
+        """
+        저장된 파티션을 하나의 데이터프레임으로 읽기
+
+        Parameters
+        ----------
+        property_type : str
+            부동산 이름 (ex. 아파트)
+        trade_type : str
+            거래 유형 (ex. 매매)
+        sigungu_codes : list, optional
+            시군구코드 목록, by default None (전체)
+        start_year_month : str, optional
+            시작 연월 (ex. 201901), by default None
+        end_year_month : str, optional
+            종료 연월 (ex. 201912), by default None
+        """
+        if isinstance(sigungu_codes, str):
+            sigungu_codes = [sigungu_codes]
+        frames = []
+        for p_type, t_type, code, year_month in self.partitions(property_type, trade_type):
+            if sigungu_codes is not None and code not in sigungu_codes:
+                continue
+            if start_year_month and year_month < str(start_year_month):
+                continue
+            if end_year_month and year_month > str(end_year_month):
+                continue
+            frames.append(self.read(p_type, t_type, code, year_month))
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, axis=0, ignore_index=True)
+
+
+class TableStore:
+    """
+    키 컬럼 기준 테이블 저장소
+
+    하나의 데이터프레임을 directory/name.pkl 파일로 저장하고, 새로 받은 행을
+    키 컬럼 기준으로 반영(upsert)합니다. 마지막으로 반영한 자료의 기준일(watermark)은
+    directory/name.json 파일에 기록하여 다음 동기화에서 변경분만 요청할 수 있게 합니다.
+
+    Parameters
+    ----------
+    directory : str
+        테이블 파일 저장 경로
+    key : str
+        행을 구분하는 키 컬럼명, by default "bizesId"
+    name : str
+        테이블 이름 (파일 이름), by default "table"
+
+    Examples
+    --------
+    >>> import PublicDataReader as pdr
+    >>> store = pdr.TableStore("./semas", key="bizesId", name="stores")
+    >>> api = pdr.SmallShop(service_key)
+    >>> api.sync(store, start_date="20230101")
+    >>> df = store.load()
+    """
+
+    extension = ".pkl"
+
+    def __init__(self, directory, key="bizesId", name="table"):
+        self.directory = os.path.expanduser(directory)
+        self.key = key
+        self.name = name
+        os.makedirs(self.directory, exist_ok=True)
+
+    @property
+    def path(self):
+        return os.path.join(self.directory, self.name + self.extension)
+
+    @property
+    def meta_path(self):
+        return os.path.join(self.directory, self.name + ".json")
+
+    @property
+    def watermark(self):
+        """
+        마지막으로 반영한 자료의 기준일 (없으면 None)
+        """
+        if not os.path.exists(self.meta_path):
+            return None
+        with open(self.meta_path, encoding="utf-8") as f:
+            return json.load(f).get("watermark")
+
+    def load(self):
+        """
+        저장된 테이블 읽기 (없으면 빈 데이터프레임)
+        """
+        if not os.path.exists(self.path):
+            return pd.DataFrame()
+        return pd.read_pickle(self.path)
+
+    def upsert(self, df, watermark=None):
+        """
+        키 컬럼 기준으로 행 반영
+
+        저장된 테이블에 같은 키의 행이 있으면 새 행으로 교체하고, 없으면 추가합니다.
+        같은 키가 df에 여러 번 있으면 마지막 행을 사용합니다.
+
+        Parameters
+        ----------
+        df : DataFrame
+            반영할 행
+        watermark : str, optional
+            테이블을 저장한 뒤 기록할 기준일, by default None (기준일 변경 안 함)
+
+        Returns
+        -------
+        tuple
+            (추가한 행 수, 교체한 행 수)
+        """
+        current = self.load()
+        changes = df.drop_duplicates(subset=self.key, keep="last")
+        if current.empty:
+            merged, updated = changes.reset_index(drop=True), 0
+        else:
+            # 키 해시 조회로 교체할 행을 찾고, 나머지 행 뒤에 새 행을 붙임
+            replaced = current[self.key].isin(changes[self.key]).to_numpy()
+            updated = int(replaced.sum())
+            merged = pd.concat([current[~replaced], changes], axis=0, ignore_index=True)
+        _atomic_write(self.path, merged.to_pickle)
+        # 테이블을 저장한 뒤에 기준일을 기록하여 중단되면 이전 기준일부터 다시 요청
+        if watermark is not None:
+            _atomic_write(self.meta_path, lambda path: self._write_meta(path, watermark))
+        return len(changes) - updated, updated
+
+    @staticmethod
+    def _write_meta(path, watermark):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"watermark": str(watermark)}, f)
@@ -0,0 +1,218 @@
+"""
+HTTP 요청 공용 전송 모듈
+
+모든 Open API 클래스가 하나의 requests.Session을 공유하도록 하여
+호스트별 keep-alive 커넥션 풀을 재사용합니다.
+"""
+import time
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from .retry import RetryPolicy, get_result_code
+from .ratelimit import RateLimiter, DEFAULT_HOST_LIMITS
+
+
+class Transport:
+    """
+    HTTP 요청 공용 전송 클래스
+
+    requests.Session과 HTTPAdapter를 사용하여 호스트(scheme, host, port)별
+    커넥션 풀을 유지합니다. 같은 Transport 인스턴스를 여러 API 클래스에
+    전달하면 TCP 연결과 TLS 핸드셰이크를 재사용할 수 있습니다.
+
+    Parameters
+    ----------
+    pool_connections : int
+        커넥션 풀을 유지할 호스트 수 (기본값: 10)
+    pool_maxsize : int
+        호스트별 최대 커넥션 수 (기본값: 10)
+    timeout : float, tuple, optional
+        요청 타임아웃(초), by default None
+    rate_limiter : RateLimiter, optional
+        호스트별, 서비스키별 요청 속도 제한, by default None (제한 없음)
+        기본 공용 Transport(get_transport)는 공공데이터포털 요청을 초당 30건으로 제한합니다.
+    retry_policy : RetryPolicy, optional
+        일시적인 오류 재시도 정책, by default None (기본 RetryPolicy 사용)
+        재시도하지 않으려면 RetryPolicy(max_retries=0)을 전달합니다.
+    cache : ResponseCache, optional
+        GET 요청 응답 디스크 캐시, by default None (캐시 사용 안 함)
+
+    Examples
+    --------
+    >>> import PublicDataReader as pdr
+    >>> transport = pdr.Transport(pool_connections=20, pool_maxsize=20)
+    >>> api = pdr.TransactionPrice(service_key, transport=transport)
+    >>> building = pdr.BuildingLedger(service_key, transport=transport)
+    """
+
+    def __init__(self, pool_connections=10, pool_maxsize=10, timeout=None, rate_limiter=None, retry_policy=None, cache=None):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.cache = cache
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections,
+                              pool_maxsize=pool_maxsize)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def request(self, method, url, key_pool=None, key_param="serviceKey", **kwargs):
+        """
+        HTTP 요청
+
+        재시도 정책에 따라 일시적인 오류는 백오프 후 다시 요청하며,
+        반환되는 응답의 attempts 속성에 시도 횟수를 기록합니다.
+        재시도 후에도 실패하면 마지막 응답을 반환하거나 마지막 예외를 발생시킵니다.
+
+        Parameters
+        ----------
+        method : str
+            HTTP 메서드 (ex. GET, POST)
+        url : str
+            요청 URL
+        key_pool : ServiceKeyPool, optional
+            서비스키 풀, by default None
+            지정하면 시도마다 서비스키를 풀에서 골라 key_param 파라미터로 전달하고,
+            요청 한도를 초과한 서비스키는 제외한 뒤 다른 서비스키로 바로 다시 요청합니다.
+        key_param : str, optional
+            서비스키 파라미터 이름, by default "serviceKey"
+            응답 캐시 키를 만들 때 이 파라미터는 제외됩니다.
+        **kwargs : dict
+            requests.Session.request에 전달할 인자
+        """
+        if self.timeout is not None:
+            kwargs.setdefault("timeout", self.timeout)
+        # 캐시된 응답이 있으면 요청하지 않음
+        cache = self.cache if method.upper() == "GET" else None
+        if cache is not None:
+            response = cache.get(method, url, kwargs.get("params"), exclude=(key_param,))
+            if response is not None:
+                return response
+        policy = self.retry_policy
+        attempt = 0
+        attempts = 0
+        # 요청 한도 초과로 서비스키를 바꿔 다시 요청한 횟수 (백오프 재시도와 구분)
+        rotations = 0
+        while True:
+            attempts += 1
+            # 서비스키 풀에서 서비스키 선택
+            key = None
+            if key_pool is not None:
+                key = key_pool.get()
+                kwargs["params"] = dict(kwargs.get("params") or {}, **{key_param: key})
+            # 요청 속도 제한
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(url, kwargs.get("params"))
+            response, error = None, None
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except requests.exceptions.RequestException as e:
+                error = e
+            # 요청 한도를 초과한 서비스키는 제외하고 다른 서비스키로 재요청
+            if key is not None and response is not None \
+                    and get_result_code(response) in key_pool.quota_codes:
+                key_pool.suspend(key)
+                if key_pool.available() > 0:
+                    rotations += 1
+                    continue
+                policy.record(attempts, failed=True, rotations=rotations)
+                response.attempts = attempts
+                return response
+            retryable = policy.is_retryable(response, error)
+            if not retryable or attempt >= policy.max_retries:
+                policy.record(attempts, failed=retryable, rotations=rotations)
+                if error is not None:
+                    raise error
+                response.attempts = attempts
+                if cache is not None:
+                    cache.set(method, url, kwargs.get("params"), response, exclude=(key_param,))
+                return response
+            # 백오프 후 재시도
+            time.sleep(policy.get_backoff(attempt))
+            attempt += 1
+
+    def get(self, url, params=None, **kwargs):
+        """
+        GET 요청
+        """
+        return self.request("GET", url, params=params, **kwargs)
+
+    def post(self, url, params=None, json=None, **kwargs):
+        """
+        POST 요청
+        """
+        return self.request("POST", url, params=params, json=json, **kwargs)
+
+    def probe(self, url, params=None, timeout=5, **kwargs):
+        """
+        상태 확인용 GET 요청
+
+        서비스 상태를 빠르게 확인하기 위해 재시도와 응답 캐시 없이 한 번만 요청합니다.
+        요청 속도 제한은 일반 요청과 같이 적용됩니다.
+
+        Parameters
+        ----------
+        url : str
+            요청 URL
+        params : dict, optional
+            요청 파라미터, by default None
+        timeout : float, optional
+            요청 타임아웃(초), by default 5
+        **kwargs : dict
+            requests.Session.request에 전달할 인자
+
+        Raises
+        ------
+        requests.exceptions.RequestException
+            연결 실패, 타임아웃 등 요청 오류
+        """
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(url, params)
+        return self.session.get(url, params=params, timeout=timeout, **kwargs)
+
+    def close(self):
+        """
+        커넥션 풀 종료
+        """
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+_default_transport = None
+_default_transport_lock = threading.Lock()
+
+
+def get_transport():
+    """
+    기본 공용 Transport 인스턴스 반환
+
+    transport 인자를 지정하지 않은 모든 API 클래스가 이 인스턴스를 공유합니다.
+    공공데이터포털(apis.data.go.kr) 요청은 초당 30건으로 제한하며(DEFAULT_HOST_LIMITS),
+    다른 제한이 필요하면 rate_limiter를 설정한 Transport를 set_transport로 지정합니다.
+    """
+    global _default_transport
+    with _default_transport_lock:
+        if _default_transport is None:
+            _default_transport = Transport(rate_limiter=RateLimiter(host_limits=DEFAULT_HOST_LIMITS))
+        return _default_transport
+
+
+def set_transport(transport):
+    """
+    기본 공용 Transport 인스턴스 변경
+
+    Parameters
+    ----------
+    transport : Transport
+        이후 생성되는 API 클래스가 기본으로 사용할 Transport 인스턴스
+    """
+    global _default_transport
+    with _default_transport_lock:
+        _default_transport = transport
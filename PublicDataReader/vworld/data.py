@@ -1,8 +1,8 @@
 """
 Vworld 데이터 API Python Module
 """
-import requests
 from ..utils.code import get_vworld_data_api_info_by_dict
+from ..utils.transport import get_transport
 
 
 class VworldData:
@@ -14,10 +14,13 @@ class VworldData:
     ----------
     apiKey : str
         Vworld Open API 서비스 인증키
+    transport : Transport, optional
+        HTTP 요청 공용 전송 객체, by default None (기본 공용 객체 사용)
     """
 
-    def __init__(self, apiKey):
+    def __init__(self, apiKey, transport=None):
         self.apiKey = apiKey
+        self.transport = transport or get_transport()
         self.url = "http://api.vworld.kr/req/data"
 
     def get_data(self, **kwargs):
@@ -35,29 +38,59 @@ class VworldData:
         dict
             API 호출 결과를 반환합니다.
         """
-        try:
-            kwargs["key"] = self.apiKey
-            kwargs["service"] = "data"
-            kwargs["request"] = "GetFeature"
-            kwargs["page"] = 1
-            kwargs["size"] = 1000
-            if kwargs.get("serviceName"):
-                kwargs["data"] = get_vworld_data_api_info_by_dict()[
-                    kwargs["serviceName"]]
-        except:
+        if kwargs.get("serviceName") and \
+                kwargs["serviceName"] not in get_vworld_data_api_info_by_dict():
             print("Incorrect Value!")
             return None
         featureCollection = {"type": "FeatureCollection", "features": []}
         try:
-            while True:
-                res = requests.get(self.url, params=kwargs,
-                                   verify=False).json()
-                kwargs["page"] = int(kwargs["page"]) + 1
-                featureCollection["features"].extend(
-                    res["response"]["result"]["featureCollection"]["features"])
-                if res['response']['page']['current'] == res['response']['page']['total']:
-                    break
+            for features in self.iter_pages(**kwargs):
+                featureCollection["features"].extend(features)
         except:
             print("Error!")
             pass
         return featureCollection
+
+    def iter_pages(self, **kwargs):
+        """페이지별 API 호출 제너레이터
+
+        페이지별 응답을 받는 대로 피처(Feature) 목록을 반환합니다.
+
+        Parameters
+        ----------
+        **kwargs : dict
+            get_data와 같은 API 호출 파라미터를 입력합니다.
+
+        Yields
+        ------
+        list
+            페이지 하나의 피처 목록
+        """
+        kwargs["key"] = self.apiKey
+        kwargs["service"] = "data"
+        kwargs["request"] = "GetFeature"
+        kwargs["page"] = 1
+        kwargs["size"] = 1000
+        if kwargs.get("serviceName"):
+            kwargs["data"] = get_vworld_data_api_info_by_dict()[
+                kwargs["serviceName"]]
+        while True:
+            res = self.transport.get(self.url, params=kwargs,
+                                     verify=False, key_param="key").json()
+            kwargs["page"] = int(kwargs["page"]) + 1
+            yield res["response"]["result"]["featureCollection"]["features"]
+            if res['response']['page']['current'] == res['response']['page']['total']:
+                break
+
+    def iter_records(self, **kwargs):
+        """피처별 API 호출 제너레이터
+
+        iter_pages의 결과를 피처(Feature) 1개씩 반환합니다.
+
+        Yields
+        ------
+        dict
+            피처 1개
+        """
+        for features in self.iter_pages(**kwargs):
+            yield from features
@@ -0,0 +1,76 @@
+"""
+XML 응답 파싱 성능 비교
+
+아파트 매매 실거래가 응답 형식의 XML을 만들어 xmltodict 방식과
+PublicDataReader.utils.parser.parse_xml 방식의 데이터프레임 생성 시간과
+최대 메모리 사용량을 비교합니다.
+
+사용 방법
+python etc/benchmark_parser.py 100000
+"""
+import sys
+import time
+import tracemalloc
+import xmltodict
+import pandas as pd
+from PublicDataReader.utils.parser import parse_xml
+from PublicDataReader.utils.frame import FrameBuilder
+
+
+COLUMNS = ['지역코드', '도로명', '법정동', '지번', '아파트', '건축년도', '층', '전용면적', '년', '월', '일', '거래금액', '도로명건물본번호코드', '도로명건물부번호코드', '도로명시군구코드', '도로명일련번호코드', '도로명지상지하코드', '도로명코드', '법정동본번코드', '법정동부번코드', '법정동시군구코드', '법정동읍면동코드', '법정동지번코드', '일련번호', '거래유형', '중개사소재지', '해제사유발생일', '해제여부']
+
+
+def make_response(n):
+    items = []
+    for i in range(n):
+        values = {
+            '지역코드': '11110', '도로명': f'도로{i % 50}', '법정동': f' 동{i % 30}', '지번': str(i),
+            '아파트': f'아파트{i % 200}', '건축년도': str(1980 + i % 40), '층': str(i % 30),
+            '전용면적': f'{59 + i % 60}.{i % 100}', '년': '2022', '월': str(1 + i % 12), '일': str(1 + i % 28),
+            '거래금액': f'    {100000 + i:,}', '도로명건물본번호코드': '00010', '도로명건물부번호코드': '00000',
+            '도로명시군구코드': '11110', '도로명일련번호코드': '01', '도로명지상지하코드': '0', '도로명코드': '4100135',
+            '법정동본번코드': '0001', '법정동부번코드': '0000', '법정동시군구코드': '11110', '법정동읍면동코드': '10100',
+            '법정동지번코드': '1', '일련번호': f'11110-{i}', '거래유형': '중개거래', '중개사소재지': '서울 종로구',
+            '해제사유발생일': ' ', '해제여부': ' ',
+        }
+        items.append("<item>" + "".join(f"<{k}>{v}</{k}>" for k, v in values.items()) + "</item>")
+    return (
+        "<?xml version=\"1.0\" encoding=\"UTF-8\" standalone=\"yes\"?><response><header>"
+        "<resultCode>00</resultCode><resultMsg>NORMAL SERVICE.</resultMsg></header><body><items>"
+        + "".join(items)
+        + f"</items><numOfRows>99999</numOfRows><pageNo>1</pageNo><totalCount>{n}</totalCount></body></response>"
+    ).encode("utf-8")
+
+
+def with_xmltodict(content):
+    data = xmltodict.parse(content.decode("utf-8"))['response']['body']['items']['item']
+    return pd.concat([pd.DataFrame(columns=COLUMNS), pd.DataFrame(data)], axis=0, ignore_index=True)
+
+
+def with_parser(content):
+    builder = FrameBuilder(COLUMNS)
+    builder.add_columns(parse_xml(content).columns)
+    return builder.build()
+
+
+def measure(func, content):
+    start = time.perf_counter()
+    df = func(content)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    func(content)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return df, elapsed, peak / 1024 ** 2
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    content = make_response(n)
+    print(f"행 수: {n:,}, 응답 크기: {len(content) / 1024 ** 2:.1f}MB")
+    results = {}
+    for name, func in [("xmltodict", with_xmltodict), ("parse_xml", with_parser)]:
+        df, elapsed, peak = measure(func, content)
+        results[name] = df
+        print(f"{name:>10}: {elapsed:6.2f}초, 최대 메모리 {peak:7.1f}MB")
+    print("결과 동일:", results["xmltodict"].equals(results["parse_xml"]))
@@ -0,0 +1,72 @@
+"""
+서울 열린데이터 광장 응답 형식별 변환 성능 비교
+
+버스노선별 정류장별 승하차 인원 정보 응답 형식의 XML, JSON 페이지(1,000행 단위)를 만들어
+Transportation의 XML 변환 방식과 JSON 변환 방식의 응답 크기와 변환 시간을 비교합니다.
+
+사용 방법
+python etc/benchmark_seoul.py 40000
+"""
+import sys
+import json
+import time
+from PublicDataReader.Seoul.transportation import Transportation
+
+
+SERVICE = "CardBusStatisticsServiceNew"
+COLUMNS = ['USE_DT', 'BUS_ROUTE_ID', 'BUS_ROUTE_NO', 'BUS_ROUTE_NM', 'STND_BSST_ID', 'BSST_ARS_NO', 'BUS_STA_NM', 'RIDE_PASGR_NUM', 'ALIGHT_PASGR_NUM', 'WORK_DT']
+
+
+def make_rows(start, end):
+    rows = []
+    for i in range(start, end):
+        rows.append({
+            'USE_DT': '20221001', 'BUS_ROUTE_ID': str(100100000 + i % 700), 'BUS_ROUTE_NO': str(100 + i % 700),
+            'BUS_ROUTE_NM': f'{100 + i % 700}번(기점~종점)', 'STND_BSST_ID': str(100000000 + i),
+            'BSST_ARS_NO': f'{i % 25000:05d}', 'BUS_STA_NM': f'정류장{i}',
+            'RIDE_PASGR_NUM': float(i % 500), 'ALIGHT_PASGR_NUM': float(i % 400), 'WORK_DT': '20221004',
+        })
+    return rows
+
+
+def to_xml(rows, total):
+    def fmt(value):
+        return str(int(value)) if isinstance(value, float) else value
+    items = "".join("<row>" + "".join(f"<{k}>{fmt(v)}</{k}>" for k, v in row.items()) + "</row>" for row in rows)
+    return (f"<?xml version=\"1.0\" encoding=\"UTF-8\"?><{SERVICE}><list_total_count>{total}</list_total_count>"
+            f"<RESULT><CODE>INFO-000</CODE><MESSAGE>정상 처리되었습니다</MESSAGE></RESULT>{items}</{SERVICE}>").encode("utf-8")
+
+
+def to_json(rows, total):
+    doc = {SERVICE: {"list_total_count": total,
+                     "RESULT": {"CODE": "INFO-000", "MESSAGE": "정상 처리되었습니다"},
+                     "row": rows}}
+    return json.dumps(doc, ensure_ascii=False).encode("utf-8")
+
+
+def measure(decode, pages):
+    start = time.perf_counter()
+    result = {col: [] for col in COLUMNS}
+    for page in pages:
+        _, _, data = decode(page)
+        for col in COLUMNS:
+            result[col].extend(data[col])
+    return result, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 40000
+    windows = [(start, min(start + 1000, n)) for start in range(0, n, 1000)]
+    xml_pages = [to_xml(make_rows(start, end), n) for start, end in windows]
+    json_pages = [to_json(make_rows(start, end), n) for start, end in windows]
+    print(f"행 수: {n:,}, 페이지 수: {len(windows)}")
+    results = {}
+    for name, decode, pages in [
+        ("xml", lambda page: Transportation._decode_xml(page.decode("utf-8"), COLUMNS), xml_pages),
+        ("json", lambda page: Transportation._decode_json(page, COLUMNS), json_pages),
+    ]:
+        result, elapsed = measure(decode, pages)
+        results[name] = result
+        size = sum(len(page) for page in pages) / 1024 ** 2
+        print(f"{name:>5}: 응답 크기 {size:6.1f}MB, 변환 {elapsed:6.2f}초")
+    print("결과 동일:", results["xml"] == results["json"])